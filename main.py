@@ -1,13 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
+from scipy import fft as sp_fft
 import pyaudio
 import threading
 import queue
 import time
-from collections import deque, defaultdict
+import math
 import sys
-import random
+from bisect import bisect_right
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  VOCAL RIYAAZ v4  — "Ancient Raga × Modern Oscilloscope"
@@ -49,6 +50,14 @@ class VocalRiyaaz:
     RANGE_MALE_SA   = (48, 55)   # C3 – G3
     RANGE_FEMALE_SA = (55, 62)   # G3 – D4
 
+    # Quick-pick Sa buttons on the setup page: (voice label, MIDI)
+    VOICE_PRESETS = (
+        ("Bass    C3",  48), ("Baritone D3", 50), ("Baritone E3", 52),
+        ("Tenor   F3",  53), ("Tenor   G3",  55),
+        ("Mezzo   A3",  57), ("Mezzo   B3",  59),
+        ("Soprano C4",  60), ("Soprano D4",  62),
+    )
+
     # ── Scale & exercise data ──────────────────────────────────────────────
     RAGAS = {
         'All 12 Notes':                   None,
@@ -100,12 +109,23 @@ class VocalRiyaaz:
         self.NOTE_TONE_DURATION = 3   # ← CHANGE THIS NUMBER
 
         # ── Audio constants ────────────────────────────────────────────────
-        self.CHUNK    = 4096
+        self.CHUNK    = 2048    # YIN window (46 ms) — tau_max stays RATE/50
+        self.HOP      = 1024    # new samples between analyses (50 % overlap)
+        # Frame counts were tuned when a frame was 4096 samples; scale them so
+        # they keep covering the same time at the current HOP
+        self._frame_w = self.HOP / 4096             # weight of one frame in accuracy stats
+        self.STAB_N   = round(10 / self._frame_w)   # stability window (≈ 0.93 s of history)
         self.FORMAT   = pyaudio.paFloat32
         self.CHANNELS = 1
         self.RATE     = 44100
         self.running  = False
 
+        # YIN workspace (see detect_pitch_yin) — sized on the first frame and
+        # reused for every later frame of the same length _fft_n.
+        self._fft_n   = 0
+        self._fft_in  = None    # float64 frame, zero-padded for the FFT
+        self._yin_cum = None    # running Σx² with a leading 0, length N+1
+
         # ── Sargam note table ──────────────────────────────────────────────
         self.indian_notes = [
             {'name': 'Sa',   'semitones':  0},
@@ -122,38 +142,136 @@ class VocalRiyaaz:
             {'name': 'Ni',   'semitones': 11},
             {'name': "Sa'",  'semitones': 12},
         ]
+        # Ratio to Sa per note name — fixed, so get_note_freq is one multiply
+        self._ratio_by_name = {n['name']: 2.0 ** (n['semitones'] / 12.0)
+                               for n in self.indian_notes}
         self.MAIN_NOTES  = ['Sa','Re','Ga','Ma','Pa','Dha','Ni',"Sa'"]
         self.KOMAL_NOTES = ['Re♭','Ga♭','Ma#','Dha♭','Ni♭']
         self.sa_base         = 220.0   # A3 default
+        self._sa_prefix      = f"Sa: {self.sa_base:.1f} Hz"   # status-bar text, rebuilt in set_sa
+        self._last_status    = 0.0     # time of last per-frame status-bar write
+        self._status_txt     = ''      # text of that write, to skip repeats
         self.selected_sa_midi = 57    # A3 = MIDI 57 — default
+        self._key_rects      = None    # (white, black) key rects, see _piano_key_rects
+        self._key_x          = None    # white-key midi → x0, built with _key_rects
+        self._key_white_midi = None    # white-key column → midi, for hit-testing
+        self._key_black_x    = None    # sorted black-key left edges, for bisect
+        self._kb_items       = None    # (canvas, midi → item ids, freq label), see _kb_build
+        self._kb_sel         = None    # midi currently styled as selected
+        self._kb_confirm_job = None    # pending after() that clears the confirm note
         self._note_names     = ['C','C#','D','D#','E','F','F#','G','G#','A','A#','B']
+        # MIDI → (name, octave, Hz, "C#3"-style label), for keyboard and presets
+        self._midi_table     = [(self._note_names[m % 12], m // 12 - 1, self.midi_to_hz(m),
+                                 f"{self._note_names[m % 12]}{m // 12 - 1}")
+                                for m in range(128)]
+        # MIDI → (voice-range hint, colour key) shown when a key is selected
+        self._voice_hint     = [self._voice_hint_for(m) for m in range(128)]
 
         # ── Detection ─────────────────────────────────────────────────────
         self.tolerance_cents = 20
-        self.freq_buffer     = deque(maxlen=7)
-        self.freq_history    = deque(maxlen=150)
-        self.match_history   = deque(maxlen=150)
-        self.last_match_time = {}
+        # Median-smoothing window: the last ≈0.65 s of detections (7 frames
+        # of 4096 samples, scaled to HOP and kept odd), unordered ring
+        self._fb             = np.zeros(int(7 / self._frame_w) | 1)
+        self._fb_i           = 0
+        self._fb_n           = 0
+        # Pitch history: float32 ring of the last ≈14 s of detected
+        # frequencies (150 frames of 4096 samples, scaled to HOP).
+        # _fh_i is the next write slot; _fh_filled saturates at the length.
+        n_hist          = int(150 / self._frame_w)
+        self._fh        = np.zeros(n_hist, dtype=np.float32)
+        self._fh_i      = 0
+        self._fh_filled = 0
+        # Running mean / M2 over the newest STAB_N history entries, updated
+        # by _fh_push (Welford add + remove) for the stability readout
+        self._stab_n    = 0
+        self._stab_mean = 0.0
+        self._stab_m2   = 0.0
+        # Hit/miss per frame (1/0), pushed next to _fh in _poll_results so
+        # the graph can colour each history point from the matching slot.
+        self._mh        = np.zeros(n_hist, dtype=np.int8)
+        self._mh_i      = 0
+        self._mh_filled = 0
+        # Last-hit timestamp per base note, indexed via _stripped_index
+        self._stripped_index = {n['name']: i for i, n in
+                                enumerate(self.indian_notes) if n['name'] != "Sa'"}
+        self._last_match_arr = np.zeros(len(self._stripped_index))
         self.note_hold_time  = 0.8
 
+        # Integer note ids, so the guided hot path compares ints, not strings.
+        # _label_base maps every label check_note_match can emit ('Re', "Re'",
+        # 'Re₋', "Sa'") to its base-note index in _stripped_index.
+        self._note_id    = {n['name']: i for i, n in enumerate(self.indian_notes)}
+        self._note_base  = np.array([self._stripped_index[n['name'].rstrip("'")]
+                                     for n in self.indian_notes], dtype=np.int32)
+        self._label_base = {n['name'].rstrip("'") + suf:
+                                self._stripped_index[n['name'].rstrip("'")]
+                            for n in self.indian_notes for suf in ('', "'", '₋')}
+        self._note_freq  = np.zeros(len(self.indian_notes))   # Hz per note id
+        self._refresh_note_freqs()
+
+        # Match candidates in check_note_match's scan order (octave-major),
+        # as parallel note-id / multiplier / label arrays; _refresh_match_table
+        # turns them into the live Hz vector for the current Sa and raga.
+        cand = [(i, mult, n['name'] if mult == 1.0 or n['name'] == "Sa'" else
+                          n['name'].rstrip("'") + ("₋" if mult == 0.5 else "'"))
+                for mult in (0.5, 1.0, 2.0)
+                for i, n in enumerate(self.indian_notes)
+                if not (n['name'] == "Sa'" and mult != 1.0)]
+        self._cand_note  = np.array([c[0] for c in cand], dtype=np.int32)
+        self._cand_mult  = np.array([c[1] for c in cand])
+        self._cand_label = [c[2] for c in cand]
+        # Targets are stored as absolute cents (1200·log2 Hz), so a frame's
+        # distances are one scalar log2 and a vector subtract
+        self._match_tbl  = (np.empty(0), [])   # (cents, label) live candidates
+        self._near_c     = np.empty(0)
+
         # ── Session stats ──────────────────────────────────────────────────
-        self.note_stats = defaultdict(lambda: {'hits':0,'miss':0,'cents':[]})
+        # Parallel arrays indexed by base-note id (_stripped_index).  Cents
+        # error is kept as a running mean, so memory stays O(1) per note.
+        n_base = len(self._stripped_index)
+        # Integer counts: matched analysis frames, and guided notes hit /
+        # missed.  _draw_stats weighs a frame by _frame_w when it derives
+        # accuracy, so a second of singing counts as it did with 4096-sample
+        # frames.
+        self._stat_frames = np.zeros(n_base, dtype=np.int64)
+        self._stat_hits   = np.zeros(n_base, dtype=np.int64)
+        self._stat_miss   = np.zeros(n_base, dtype=np.int64)
+        self._stat_n      = np.zeros(n_base, dtype=np.int64)  # cents samples
+        self._stat_mean   = np.zeros(n_base)                  # mean cents error
 
         # ── Guided state ───────────────────────────────────────────────────
         self.guided_active       = False
         self.guided_target       = None
+        self.guided_target_id    = 0      # index into _note_freq
+        self.guided_target_base  = -1     # base-note index; -1 = no target yet
         self.guided_listen       = False
-        self.guided_listen_start = 0.0
+        self.guided_listen_start = 0       # _ring_w when the singing window opened
+        self.guided_listen_t0    = 0.0     # monotonic time of the same moment
         self.guided_step         = 0
         self.guided_sequence     = []
         self.guided_results      = []
-        self.guided_cents_buf    = []
+        self.guided_cents_buf    = np.zeros(0, dtype=np.float32)
+        self.guided_cents_n      = 0
         self.guided_glow_state   = 'idle'
+        self._rng                = np.random.default_rng()   # random drills
 
         # ── Playback ───────────────────────────────────────────────────────
         self.tone_playing  = False
         self.drone_playing = False
         self.metro_running = False
+        self._harm_mult    = np.arange(1, 7)                          # harmonic no.
+        self._harm_amps    = np.array([1.0, 0.50, 0.25, 0.13, 0.07, 0.04])
+        self._harm_cache   = {}     # n samples → (t, envelope), see _harmonium_wave
+        # One persistent output stream; _out_cb mixes whatever voices are set.
+        # 'tone' / 'drone' / 'metro' / 'click' → voice dict (see _mix_voice)
+        self._out_stream   = None
+        self._out_lock     = threading.Lock()
+        self._voices       = {}
+        self.OUT_CHUNK     = 512
+        # Drone loop for the current Sa, rebuilt only by set_sa, and the two
+        # metronome clicks — _out_cb just copies slices of these
+        self._drone_tbl    = self._drone_table(self.sa_base, self.OUT_CHUNK)
+        self._clicks       = (self._click(1100, vol=0.85), self._click(800, vol=0.60))
 
         # ── Tk variables ───────────────────────────────────────────────────
         self.sensitivity_var   = tk.DoubleVar(value=0.012)
@@ -165,19 +283,60 @@ class VocalRiyaaz:
         self.selected_exercise = tk.StringVar(value='Aaroh (scale up)')
         self.note_duration_var = tk.DoubleVar(value=3.0)
         self.current_page      = tk.StringVar(value='sa_setup')
+        self.selected_raga.trace_add('write', lambda *_: self._refresh_match_table())
+        self._refresh_match_table()
+        # Plain-float mirrors, so the tick loop and capture thread skip Tcl
+        self._note_duration    = self.note_duration_var.get()
+        self._sensitivity      = self.sensitivity_var.get()
+        self.note_duration_var.trace_add('write', lambda *_: setattr(
+            self, '_note_duration', self.note_duration_var.get()))
+        self.sensitivity_var.trace_add('write', lambda *_: setattr(
+            self, '_sensitivity', self.sensitivity_var.get()))
+        self._bpm              = self.metro_bpm.get()     # read by _out_cb
+        self._beats            = self.beats_var.get()
+        self.metro_bpm.trace_add('write', lambda *_: setattr(
+            self, '_bpm', self.metro_bpm.get()))
+        self.beats_var.trace_add('write', lambda *_: setattr(
+            self, '_beats', self.beats_var.get()))
 
         # ── PyAudio ───────────────────────────────────────────────────────
         self.p           = pyaudio.PyAudio()
         self.stream      = None
-        self.audio_queue  = queue.Queue(maxsize=10)   # raw audio (unused now, kept for compat)
         self.result_queue = queue.Queue(maxsize=10)   # processed (freq, match) results
+        self._last_frame_t = 0.0                      # monotonic stamp of newest result
+
+        # Input ring — filled by the PortAudio callback (_in_cb), drained by
+        # _audio_capture.  _ring_w / _ring_r are running sample totals.
+        self._ring   = np.zeros(2 ** 16, dtype=np.float32)
+        self._ring_w = 0
+        self._ring_r = 0
+        self._ring_evt = threading.Event()   # set by _in_cb on every new block
+
+        # Set whenever no capture thread is running; on_closing waits on it
+        self._capture_done = threading.Event()
+        self._capture_done.set()
 
         # ── Widget registries ──────────────────────────────────────────────
-        self.sargam_btns = {}
+        self.sargam_btns = {}   # name → (rect id, text id) on _sargam_canvas
         self.nav_btns    = {}
 
+        # ── Deferred widget updates (see _ui_set / _flush_ui) ─────────────
+        self._pending = {}   # widget → config kwargs waiting for the next flush
+        self._shown   = {}   # widget → config kwargs last written to Tk
+
+        # ── Coalesced canvas redraws (see _schedule_render / _do_render) ──
+        self._render_args = {}      # 'glow' / 'tuner' / 'graph' → latest draw args
+        self._render_due  = False
+        self._last_render = dict.fromkeys(self.RENDER_PERIOD, 0.0)   # element → last draw time
+        self._tuner_items = {}      # canvas → [w, h, bar_id, text_id, shown]
+        self._glow_items  = {}      # canvas → [(w, h), ring_ids, face, note, hz, label, shown]
+        self._resize_jobs = {}      # canvas key → pending after() id, see _schedule_redraw
+        self._graph_items = {}      # canvas → {'size','grid','lines','top','dots','hit'}
+        self._stats_items = None    # {'size','empty','notes'}, see _draw_stats
+
         self._init_colors()
         self._build_ui()
+        self._flush_ui()
 
     # ═══════════════════════════════════════════════════════════════════════
     #  COLOUR SYSTEM
@@ -210,6 +369,34 @@ class VocalRiyaaz:
             'komal':   '#1a0f3e',
             'sa_ring': '#f5a623',
         }
+        # Three-level status colours, indexed by how many thresholds a value
+        # clears: e.g. _status_colors[(stab>50) + (stab>80)]
+        self._status_colors = (self.C['danger'], self.C['warning'], self.C['success'])
+        # 1-px card border drawn by the widget's own highlight ring, instead
+        # of wrapping every card in a border-coloured padding Frame
+        self._card_border = dict(highlightthickness=1,
+                                 highlightbackground=self.C['border'],
+                                 highlightcolor=self.C['border'])
+        # Shared look for every flat button and horizontal slider
+        self._btn_kw   = dict(relief=tk.FLAT, cursor="hand2")
+        self._scale_kw = dict(orient=tk.HORIZONTAL, bg=self.C['panel'], fg=self.C['text'],
+                              highlightthickness=0, troughcolor=self.C['border'])
+        # Glow-circle ring colours and bottom label per state (see _draw_glow)
+        C = self.C
+        self._glow_states = {
+            'idle':    {'glow':['#0c0c20','#101028','#141432'],
+                        'face':'#101028', 'ring':'#252545', 'text':C['muted']},
+            'listen':  {'glow':['#041422','#06202e','#082a3a'],
+                        'face':'#071c2e', 'ring':C['teal'],  'text':C['teal']},
+            'singing': {'glow':['#1c1000','#261600','#301c00'],
+                        'face':'#201200', 'ring':C['saffron'],'text':C['saffron']},
+            'hit':     {'glow':['#001a08','#002814','#003520'],
+                        'face':'#001e0c', 'ring':C['success'],'text':C['success']},
+            'miss':    {'glow':['#1e0004','#280006','#320008'],
+                        'face':'#1c0004', 'ring':C['danger'], 'text':C['danger']},
+        }
+        self._glow_labels = {'listen':'LISTEN', 'singing':'SING NOW',
+                             'hit':'✓  HIT', 'miss':'✗  MISS', 'idle':''}
 
     # ═══════════════════════════════════════════════════════════════════════
     #  NOTE FREQUENCY — single source of truth
@@ -217,17 +404,34 @@ class VocalRiyaaz:
 
     def get_note_freq(self, name):
         """Compute Hz from current sa_base on every call — never cached."""
-        note = next((n for n in self.indian_notes if n['name'] == name), None)
-        return self.sa_base * (2.0 ** (note['semitones'] / 12.0)) if note else 0.0
+        return self.sa_base * self._ratio_by_name.get(name, 0.0)
+
+    def _refresh_note_freqs(self):
+        """Rebuild the per-note-id Hz table from get_note_freq (called by set_sa)."""
+        self._note_freq[:] = [self.get_note_freq(n['name']) for n in self.indian_notes]
+
+    def _refresh_match_table(self):
+        """
+        Rebuild the target Hz vectors check_note_match and _cents_from_nearest
+        scan (called by set_sa and on raga change).  Each table is swapped in
+        as a whole, so the capture thread never sees a half-built one.
+        """
+        active = self.RAGAS.get(self.selected_raga.get())
+        hz     = self._note_freq[self._cand_note] * self._cand_mult
+        live   = (hz >= 60) & (hz <= 1200)
+        if active is not None:
+            live &= [lbl.rstrip("'₋") in active or lbl == "Sa'"
+                     for lbl in self._cand_label]
+        idx = np.flatnonzero(live)
+        self._match_tbl = (1200 * np.log2(hz[idx]), [self._cand_label[i] for i in idx])
+        near = np.outer(self._note_freq, (0.5, 1.0, 2.0)).ravel()
+        self._near_c  = 1200 * np.log2(near[(near >= 60) & (near <= 1200)])
 
     def _western_name(self, freq):
-        names = ['C','C#','D','D#','E','F','F#','G','G#','A','A#','B']
         if freq <= 0:
             return ''
-        st  = 12 * np.log2(freq / 130.81)
-        idx = int(round(st)) % 12
-        oct_= 3 + int(round(st)) // 12
-        return f"{names[idx]}{oct_}"
+        st = int(round(12 * math.log2(freq / 130.81)))   # semitones from C3
+        return f"{self._note_names[st % 12]}{3 + st // 12}"
 
     @staticmethod
     def midi_to_hz(midi):
@@ -237,6 +441,10 @@ class VocalRiyaaz:
     def set_sa(self, freq):
         """Central point to change Sa. Refreshes everything."""
         self.sa_base = float(freq)
+        self._sa_prefix = f"Sa: {self.sa_base:.1f} Hz"
+        self._refresh_note_freqs()
+        self._refresh_match_table()
+        self._drone_tbl = self._drone_table(self.sa_base, self.OUT_CHUNK)
         self._refresh_sargam_buttons()
         try:
             self.sa_pill_lbl.config(text=f"{self.sa_base:.1f} Hz")
@@ -245,27 +453,47 @@ class VocalRiyaaz:
         self.status_bar.config(text=f"✅  Sa set to {self.sa_base:.1f} Hz  ({self._western_name(self.sa_base)})")
 
     def _refresh_sargam_buttons(self):
-        for name, btn in self.sargam_btns.items():
-            freq = self.get_note_freq(name)
-            btn.config(text=f"{name}\n{freq:.1f}")
+        cv = getattr(self, '_sargam_canvas', None)
+        if cv is None:
+            return
+        for name, (_, txt) in self.sargam_btns.items():
+            cv.itemconfigure(txt, text=f"{name}\n{self.get_note_freq(name):.1f}")
+
+    # Sargam cell size and spacing on _sargam_canvas (pixels)
+    _SG_W, _SG_H, _SG_GAP = 70, 38, 4
+
+    def _sargam_click(self, event):
+        """Map a click on the sargam canvas to its cell and play that note."""
+        col, dx = divmod(event.x - self._SG_GAP, self._SG_W + self._SG_GAP)
+        row, dy = divmod(event.y - self._SG_GAP, self._SG_H + self._SG_GAP)
+        # Ignore clicks in the gaps between cells or past the end of a row
+        if 0 <= row < 2 and 0 <= col < len(self._sargam_rows[row]) \
+                and dx < self._SG_W and dy < self._SG_H:
+            self.play_note_tone(self._sargam_rows[row][col])
 
     # ═══════════════════════════════════════════════════════════════════════
     #  HARMONIUM SYNTHESIS
     # ═══════════════════════════════════════════════════════════════════════
 
     def _harmonium_wave(self, frequency, duration=1.5, volume=0.55):
-        n  = int(self.RATE * duration)
-        t  = np.linspace(0, duration, n, endpoint=False)
-        harmonics = [(1,1.0),(2,0.50),(3,0.25),(4,0.13),(5,0.07),(6,0.04)]
-        wave = sum(a * np.sin(2*np.pi*frequency*h*t) for h,a in harmonics)
-        wave /= np.max(np.abs(wave) + 1e-9)
-        wave *= volume
-        atk = int(0.04*self.RATE); dec = int(0.10*self.RATE); rel = int(0.14*self.RATE)
-        env = np.ones(n)
-        if atk:               env[:atk]        = np.linspace(0, 1, atk)
-        if atk+dec < n:       env[atk:atk+dec] = np.linspace(1, 0.80, dec)
-        if n > rel:           env[-rel:]        = np.linspace(0.80, 0, rel)
-        return (wave * env).astype(np.float32)
+        n = int(self.RATE * duration)
+        if n not in self._harm_cache:
+            # Time base and ADSR envelope depend only on length — build once
+            t   = np.arange(n) / self.RATE
+            atk = int(0.04*self.RATE); dec = int(0.10*self.RATE); rel = int(0.14*self.RATE)
+            env = np.ones(n)
+            if atk:               env[:atk]        = np.linspace(0, 1, atk)
+            if atk+dec < n:       env[atk:atk+dec] = np.linspace(1, 0.80, dec)
+            if n > rel:           env[-rel:]        = np.linspace(0.80, 0, rel)
+            self._harm_cache[n] = (t, env)
+        t, env = self._harm_cache[n]
+        # All six partials in one in-place sin() over a single (6, n) phase
+        # block, summed by a matmul
+        ph    = np.outer(2*np.pi*frequency*self._harm_mult, t)
+        wave  = self._harm_amps @ np.sin(ph, out=ph)
+        wave *= volume / np.max(np.abs(wave) + 1e-9)
+        wave *= env
+        return wave.astype(np.float32)
 
     def play_note_tone(self, note_name_or_freq):
         """Accepts note NAME (looked up live) or raw Hz float.
@@ -274,21 +502,83 @@ class VocalRiyaaz:
             freq = self.get_note_freq(note_name_or_freq)
         else:
             freq = float(note_name_or_freq)
-        if freq <= 0 or self.tone_playing:
+        if freq <= 0 or self.tone_playing or not self._out_start():
             return
-        self.tone_playing = True
         duration = self.NOTE_TONE_DURATION   # ← reads from user config
-        def _play():
-            try:
-                wave = self._harmonium_wave(freq, duration=duration)
-                out  = self.p.open(format=pyaudio.paFloat32, channels=1,
-                                   rate=self.RATE, output=True)
-                out.write(wave.tobytes()); out.stop_stream(); out.close()
-            except Exception as e:
-                print(f"Tone err: {e}")
-            finally:
-                self.tone_playing = False
-        threading.Thread(target=_play, daemon=True).start()
+        # Synthesis takes a few ms per second of tone — keep it off the Tk
+        # thread; tone_playing blocks a second tone until the mixer ends it
+        self.tone_playing = True
+        threading.Thread(target=self._tone_render, args=(freq, duration),
+                         daemon=True).start()
+
+    def _tone_render(self, freq, duration):
+        """Worker: build the harmonium tone and hand it to the mixer."""
+        wave = self._harmonium_wave(freq, duration=duration)
+        self._voice_set('tone', {'buf': wave, 'pos': 0, 'delay': 0})
+
+    # ── Output mixer ───────────────────────────────────────────────────────
+    #  A single PortAudio output stream stays open from the first sound to
+    #  shutdown.  Tone, drone and metronome are voices in self._voices that
+    #  _out_cb sums into each buffer — no per-sound stream open/close.
+
+    def _out_start(self):
+        """Open the shared output stream on first use.  False if no device."""
+        if self._out_stream is not None:
+            return True
+        try:
+            self._out_stream = self.p.open(format=pyaudio.paFloat32, channels=1,
+                                           rate=self.RATE, output=True,
+                                           frames_per_buffer=self.OUT_CHUNK,
+                                           stream_callback=self._out_cb)
+            return True
+        except Exception as e:
+            print(f"Output err: {e}")
+            return False
+
+    def _voice_set(self, name, voice):
+        with self._out_lock:
+            if voice is None: self._voices.pop(name, None)
+            else:             self._voices[name] = voice
+
+    def _out_cb(self, in_data, frame_count, time_info, status):
+        out = np.zeros(frame_count, dtype=np.float32)
+        with self._out_lock:
+            if 'metro' in self._voices:
+                self._metro_tick(self._voices['metro'], frame_count)
+            for name, v in list(self._voices.items()):
+                if not self._mix_voice(v, out):
+                    del self._voices[name]
+                    if name == 'tone': self.tone_playing = False
+        np.clip(out, -1.0, 1.0, out=out)
+        return (out.tobytes(), pyaudio.paContinue)
+
+    def _mix_voice(self, v, out):
+        """
+        Add voice v into out.  One-shots play buf once after 'delay' silent
+        samples; the drone cycles _drone_tbl, whose tail repeats its head so
+        a buffer of up to OUT_CHUNK is one slice.  Larger host buffers are
+        filled in several slices.  False when done.
+        """
+        if 'loop' in v:
+            buf, L = self._drone_tbl                     # swapped by set_sa
+            p = v['pos'] % L; i = 0; n = out.size
+            while i < n:
+                k = min(n - i, buf.size - p)
+                out[i:i+k] += buf[p:p+k]
+                i += k; p = (p + k) % L
+            v['pos'] = p
+            return True
+        if 'until' in v:                                 # metro scheduler
+            return True
+        d = v['delay']; n = out.size
+        if d >= n:
+            v['delay'] = d - n
+            return True
+        buf, p = v['buf'], v['pos']
+        k = min(n - d, buf.size - p)
+        out[d:d+k] += buf[p:p+k]
+        v['pos'] = p + k; v['delay'] = 0
+        return v['pos'] < buf.size
 
     # ── Drone ──────────────────────────────────────────────────────────────
 
@@ -296,29 +586,30 @@ class VocalRiyaaz:
         C = self.C
         if self.drone_playing:
             self.drone_playing = False
+            self._voice_set('drone', None)
             self.drone_btn.config(text="🎵  Sa Drone", bg=C['border'], fg=C['text'])
-        else:
+        elif self._out_start():
             self.drone_playing = True
+            self._voice_set('drone', {'loop': True, 'pos': 0})
             self.drone_btn.config(text="🔇  Stop Drone", bg=C['success'], fg='black')
-            threading.Thread(target=self._drone_loop, daemon=True).start()
 
-    def _drone_loop(self):
-        CHUNK = 2048
-        try:
-            out = self.p.open(format=pyaudio.paFloat32, channels=1,
-                              rate=self.RATE, output=True, frames_per_buffer=CHUNK)
-            while self.drone_playing:
-                sa = self.sa_base
-                t  = np.linspace(0, CHUNK/self.RATE, CHUNK, endpoint=False)
-                w  = (0.40*np.sin(2*np.pi*sa*t)
-                    + 0.20*np.sin(2*np.pi*sa*2*t)
-                    + 0.18*np.sin(2*np.pi*sa*1.5*t)
-                    + 0.06*np.sin(2*np.pi*sa*4*t))
-                w /= np.max(np.abs(w)+1e-9)
-                out.write((w*0.45).astype(np.float32).tobytes())
-            out.stop_stream(); out.close()
-        except Exception as e:
-            print(f"Drone err: {e}")
+    def _drone_table(self, sa, chunk):
+        """
+        One seamless loop of the drone (Sa, Sa', Pa, Sa'') as float32.
+        The mix repeats every two Sa periods (Pa = 1.5·Sa); the loop holds
+        enough of those, rounded to whole samples, to be ≥ 2048 long, so
+        pitch is off by well under a cent.  chunk extra samples are appended
+        so any chunk can be sliced out without wrapping.
+        """
+        pair   = 2 * self.RATE / sa
+        cycles = max(1, int(np.ceil(max(chunk, 2048) / pair)))
+        L      = int(round(cycles * pair))
+        ph     = 2*np.pi * 2*cycles * np.arange(L) / L     # Sa phase, exact loop
+        w = (0.40*np.sin(ph) + 0.20*np.sin(2*ph)
+           + 0.18*np.sin(1.5*ph) + 0.06*np.sin(4*ph))
+        w *= 0.45 / np.max(np.abs(w)+1e-9)
+        w  = w.astype(np.float32)
+        return np.concatenate((w, w[:chunk])), L
 
     # ── Metronome ──────────────────────────────────────────────────────────
 
@@ -326,29 +617,31 @@ class VocalRiyaaz:
         C = self.C
         if self.metro_running:
             self.metro_running = False
+            self._voice_set('metro', None)
             self.metro_btn.config(text="▶  Metro", bg=C['border'], fg=C['text'])
-        else:
+        elif self._out_start():
             self.metro_running = True
+            self._voice_set('metro', {'until': 0, 'beat': 0})
             self.metro_btn.config(text="⏸  Metro", bg=C['amber'], fg='black')
-            threading.Thread(target=self._metro_loop, daemon=True).start()
-
-    def _metro_loop(self):
-        def click(freq, dur=0.05, vol=0.75):
-            t = np.linspace(0, dur, int(self.RATE*dur), endpoint=False)
-            return (np.sin(2*np.pi*freq*t)*np.exp(-t*50)*vol).astype(np.float32)
-        hi = click(1100, vol=0.85); lo = click(800, vol=0.60)
-        beat = 0
-        try:
-            out = self.p.open(format=pyaudio.paFloat32, channels=1,
-                              rate=self.RATE, output=True)
-            while self.metro_running:
-                out.write((hi if beat == 0 else lo).tobytes())
-                beat = (beat+1) % self.beats_var.get()
-                sleep = 60.0/self.metro_bpm.get() - 0.05
-                if sleep > 0: time.sleep(sleep)
-            out.stop_stream(); out.close()
-        except Exception as e:
-            print(f"Metro err: {e}")
+
+    def _click(self, freq, dur=0.05, vol=0.75):
+        t = np.linspace(0, dur, int(self.RATE*dur), endpoint=False)
+        return (np.sin(2*np.pi*freq*t)*np.exp(-t*50)*vol).astype(np.float32)
+
+    def _metro_tick(self, m, n):
+        """
+        Sample-counted beat clock, run by _out_cb before mixing.  Any beat
+        due inside the next n samples starts a 'click' one-shot at its exact
+        offset; BPM and beat count are read live from their cached values.
+        'until' stays fractional so beats at tempos whose period is not a
+        whole number of samples don't drift.
+        """
+        while m['until'] < n:
+            self._voices['click'] = {'buf': self._clicks[m['beat'] != 0],
+                                     'pos': 0, 'delay': int(m['until'])}
+            m['beat']   = (m['beat'] + 1) % max(1, self._beats)
+            m['until'] += self.RATE * 60.0 / max(1, self._bpm)
+        m['until'] -= n
 
     # ═══════════════════════════════════════════════════════════════════════
     #  YIN PITCH DETECTION  — fully vectorized (FFT-based, O(N log N))
@@ -358,7 +651,7 @@ class VocalRiyaaz:
     #  blocked the Tkinter event loop → UI freeze → apparent crash.
     #
     #  This version computes the YIN difference function in three numpy lines
-    #  using FFT autocorrelation.  Typical runtime: < 3 ms for CHUNK=4096.
+    #  using FFT autocorrelation.  Typical runtime: < 3 ms for CHUNK=2048.
     # ═══════════════════════════════════════════════════════════════════════
 
     def detect_pitch_yin(self, audio_data):
@@ -367,26 +660,36 @@ class VocalRiyaaz:
         tau_min = max(2,       int(self.RATE / 1000)) # min period → 1000 Hz ceiling
 
         # ── Step 1: FFT-based autocorrelation ─────────────────────────────
-        # Zero-pad to next power-of-2 ≥ 2N to avoid circular wrap-around.
-        fft_size = 1
-        while fft_size < 2 * N:
-            fft_size <<= 1
-        X   = np.fft.rfft(audio_data, n=fft_size)
-        acf = np.fft.irfft(X * np.conj(X))[:N].real
+        # Only lags < tau_max are needed, so zero-padding to N + tau_max is
+        # enough to keep them free of circular wrap-around; next_fast_len
+        # picks a 2·3·5-smooth size there (3000 for N=2048, vs 4096 for a
+        # full 2N power of two).  The padded buffer is preallocated; only
+        # its head is rewritten per frame.
+        if N != self._fft_n:
+            self._fft_n   = N
+            self._fft_in  = np.zeros(sp_fft.next_fast_len(N + tau_max, real=True))
+            self._yin_cum = np.zeros(N + 1)
+        x = self._fft_in[:N]
+        x[:] = audio_data                      # float32 ring → float64, one copy
+        x -= x.mean()                          # drop mic DC offset, in place
+        M   = self._fft_in.size
+        X   = sp_fft.rfft(self._fft_in)
+        acf = sp_fft.irfft(X.real ** 2 + X.imag ** 2, M)[:tau_max]
         # acf[τ] = Σ_{t=0}^{N-τ-1} x[t]·x[t+τ]   (linear, not circular)
 
         # ── Step 2: Difference function d[τ] (fully vectorized) ───────────
-        sq      = audio_data ** 2
-        sq_sum  = float(np.sum(sq))
-        cum_sq  = np.empty(N + 1)
-        cum_sq[0] = 0.0
-        np.cumsum(sq, out=cum_sq[1:])
-        # d[τ] = Σ(x[t]-x[t+τ])² = Σx[t]² + Σx[t+τ]² - 2·acf[τ]
+        # Energy prefix sums are built in place in the workspace; the τ terms
+        # below are slices of it (reversed for N-τ), not fancy-index copies.
+        cum_sq = self._yin_cum
+        np.multiply(x, x, out=cum_sq[1:])
+        np.cumsum(cum_sq[1:], out=cum_sq[1:])
+        sq_sum = float(cum_sq[N])
+        # d[τ] = Σ(x[t]-x[t+τ])² = Σx[t]² + Σx[t+τ]² - 2·acf[τ],  τ = 1..tau_max-1
         taus  = np.arange(1, tau_max)
-        d_arr = (cum_sq[N - taus]              # Σ x[0..N-τ-1]²
-               + (sq_sum - cum_sq[taus])       # Σ x[τ..N-1]²
-               - 2.0 * acf[taus])
-        d_arr = np.maximum(d_arr, 0.0)         # clip tiny negatives from float noise
+        d_arr = cum_sq[N-1:N-tau_max:-1] - cum_sq[1:tau_max]   # Σ x[0..N-τ-1]² - Σ x[0..τ-1]²
+        d_arr += sq_sum                                        # … + Σ x[τ..N-1]² folded in
+        d_arr -= 2.0 * acf[1:]
+        np.maximum(d_arr, 0.0, out=d_arr)      # clip tiny negatives from float noise
 
         # ── Step 3: CMNDF (cumulative mean normalised difference) ──────────
         cumsum_d = np.cumsum(d_arr)            # cumsum_d[i] = Σ d[1..i+1]
@@ -396,14 +699,16 @@ class VocalRiyaaz:
         dp[1:]  = np.where(nonzero, d_arr * taus / cumsum_d, 1.0)
 
         # ── Step 4: Absolute threshold — find first dip below 0.15 ────────
+        # Scanned in C: a per-tau Python loop here held the GIL for up to
+        # ~900 iterations a frame, stalling the Tk thread mid-redraw.
         tau_est = -1
-        for tau in range(tau_min, tau_max):
-            if dp[tau] < 0.15:
-                # Slide to local minimum
-                while tau + 1 < tau_max and dp[tau + 1] < dp[tau]:
-                    tau += 1
-                tau_est = tau
-                break
+        below   = np.flatnonzero(dp[tau_min:tau_max] < 0.15)
+        if below.size:
+            tau = tau_min + int(below[0])
+            # Slide to local minimum
+            while tau + 1 < tau_max and dp[tau + 1] < dp[tau]:
+                tau += 1
+            tau_est = tau
 
         if tau_est == -1:
             # Fallback: global minimum
@@ -421,10 +726,49 @@ class VocalRiyaaz:
 
         return float(self.RATE / tau_f) if tau_f > 0 else 0.0
 
+    # ── Pitch-history ring ────────────────────────────────────────────────
+
+    def _fh_push(self, freq):
+        N = self._fh.size
+        if self._fh_filled >= self.STAB_N:
+            # Entry sliding out of the stability window
+            y = float(self._fh[(self._fh_i - self.STAB_N) % N])
+            self._stab_n -= 1
+            d = y - self._stab_mean
+            self._stab_mean -= d / self._stab_n
+            self._stab_m2   -= d * (y - self._stab_mean)
+        self._fh[self._fh_i] = freq
+        x = float(self._fh[self._fh_i])       # the stored float32 value
+        self._stab_n += 1
+        d = x - self._stab_mean
+        self._stab_mean += d / self._stab_n
+        self._stab_m2   += d * (x - self._stab_mean)
+        self._fh_i      = (self._fh_i + 1) % N
+        self._fh_filled = min(self._fh_filled + 1, N)
+
+    def _fh_ordered(self):
+        """The whole filled history, oldest first."""
+        return self._ring_ordered(self._fh, self._fh_i, self._fh_filled)
+
+    def _mh_push(self, hit):
+        N = self._mh.size
+        self._mh[self._mh_i] = hit
+        self._mh_i      = (self._mh_i + 1) % N
+        self._mh_filled = min(self._mh_filled + 1, N)
+
+    @staticmethod
+    def _ring_ordered(buf, i, filled):
+        """Unroll a ring buffer (next write slot i) into oldest-first order."""
+        if filled < buf.size:
+            return buf[:filled]
+        return np.concatenate((buf[i:], buf[:i]))
+
     def _smooth(self, freq):
         if freq > 0:
-            self.freq_buffer.append(freq)
-        return float(np.median(list(self.freq_buffer))) if len(self.freq_buffer) >= 3 else freq
+            self._fb[self._fb_i] = freq
+            self._fb_i = (self._fb_i + 1) % self._fb.size
+            self._fb_n = min(self._fb_n + 1, self._fb.size)
+        return float(np.median(self._fb[:self._fb_n])) if self._fb_n >= 3 else freq
 
     # ═══════════════════════════════════════════════════════════════════════
     #  NOTE MATCHING
@@ -432,36 +776,18 @@ class VocalRiyaaz:
 
     def check_note_match(self, freq):
         if not freq or freq <= 0: return None, None
-        raga   = self.selected_raga.get()
-        active = self.RAGAS.get(raga)
-        best_name, best_cents = None, float('inf')
-        for mult in (0.5, 1.0, 2.0):
-            for n in self.indian_notes:
-                if n['name'] == "Sa'" and mult != 1.0: continue
-                if active is not None:
-                    base = n['name'].rstrip("'")
-                    if base not in active and n['name'] != "Sa'": continue
-                target = self.get_note_freq(n['name']) * mult
-                if not (60 <= target <= 1200): continue
-                cents = abs(1200 * np.log2(freq / target))
-                if cents < best_cents:
-                    best_cents = cents
-                    base = n['name'].rstrip("'")
-                    if mult == 0.5:   best_name = base + "₋"
-                    elif mult == 2.0 and n['name'] != "Sa'": best_name = base + "'"
-                    else:             best_name = n['name']
-        return (best_name, best_cents) if best_cents <= self.tolerance_cents else (None, None)
+        tc, labels = self._match_tbl
+        if not labels: return None, None
+        cents = np.abs(1200 * math.log2(freq) - tc)
+        i     = int(cents.argmin())   # first minimum, as the old scan kept
+        best  = float(cents[i])
+        return (labels[i], best) if best <= self.tolerance_cents else (None, None)
 
     def _cents_from_nearest(self, freq):
-        best = None; best_abs = float('inf')
-        for n in self.indian_notes:
-            for mult in (0.5, 1.0, 2.0):
-                t = self.get_note_freq(n['name']) * mult
-                if 60 <= t <= 1200:
-                    c = 1200 * np.log2(freq / t)
-                    if abs(c) < best_abs:
-                        best_abs = abs(c); best = c
-        return best if best is not None else 0.0
+        tc = self._near_c
+        if not tc.size: return 0.0
+        c = 1200 * math.log2(freq) - tc
+        return float(c[np.abs(c).argmin()])
 
     # ═══════════════════════════════════════════════════════════════════════
     #  UI CONSTRUCTION
@@ -495,8 +821,7 @@ class VocalRiyaaz:
         for pid, label in tabs:
             btn = tk.Button(nav, text=label, font=("Verdana",9,"bold"),
                             command=lambda p=pid: self._switch_page(p),
-                            relief=tk.FLAT, cursor="hand2",
-                            padx=14, pady=6, bd=0)
+                            padx=14, pady=6, bd=0, **self._btn_kw)
             btn.pack(side=tk.LEFT, padx=2, pady=8)
             self.nav_btns[pid] = btn
 
@@ -506,10 +831,8 @@ class VocalRiyaaz:
         tb.pack_propagate(False)
 
         # Sa pill
-        sa_pill = tk.Frame(tb, bg=C['border'], padx=1, pady=1)
-        sa_pill.pack(side=tk.LEFT, padx=12, pady=7)
-        sa_inner = tk.Frame(sa_pill, bg=C['card'], padx=10, pady=4)
-        sa_inner.pack()
+        sa_inner = tk.Frame(tb, bg=C['card'], padx=10, pady=4, **self._card_border)
+        sa_inner.pack(side=tk.LEFT, padx=12, pady=7)
         tk.Label(sa_inner, text="Sa", font=("Verdana",8), fg=C['muted'],
                  bg=C['card']).pack(side=tk.LEFT)
         self.sa_pill_lbl = tk.Label(sa_inner, text=f"{self.sa_base:.1f} Hz",
@@ -527,7 +850,7 @@ class VocalRiyaaz:
 
         def _tb_btn(text, cmd, **kw):
             b = tk.Button(tb, text=text, command=cmd, font=("Verdana",8,"bold"),
-                          relief=tk.FLAT, cursor="hand2", padx=10, pady=5, bd=0, **kw)
+                          padx=10, pady=5, bd=0, **self._btn_kw, **kw)
             b.pack(side=tk.LEFT, padx=6, pady=8)
             return b
 
@@ -541,10 +864,9 @@ class VocalRiyaaz:
         self._bpm_lbl = tk.Label(tb, text="60 BPM", font=("Courier New",8),
                                   fg=C['muted'], bg=C['panel'])
         self._bpm_lbl.pack(side=tk.LEFT, padx=3)
-        tk.Scale(tb, from_=40, to=200, resolution=1, orient=tk.HORIZONTAL,
-                 variable=self.metro_bpm, bg=C['panel'], fg=C['text'],
-                 highlightthickness=0, length=80, showvalue=False,
-                 troughcolor='#1a1a35').pack(side=tk.LEFT)
+        tk.Scale(tb, from_=40, to=200, resolution=1, variable=self.metro_bpm,
+                 length=80, showvalue=False,
+                 **dict(self._scale_kw, troughcolor='#1a1a35')).pack(side=tk.LEFT)
         for b in [3,4,6,7,8]:
             tk.Radiobutton(tb, text=str(b), variable=self.beats_var, value=b,
                            bg=C['panel'], fg=C['label'],
@@ -558,10 +880,13 @@ class VocalRiyaaz:
         self.page_host = tk.Frame(self.root, bg=C['bg'])
         self.page_host.pack(fill=tk.BOTH, expand=True)
 
+        # Only the landing page is built up front — the others are built
+        # by _switch_page the first time they are visited.
+        self._page_builders = {'free':   self._build_page_free,
+                               'guided': self._build_page_guided,
+                               'stats':  self._build_page_stats}
+        self._built_pages   = {'sa_setup'}
         self._build_page_sa_setup()
-        self._build_page_free()
-        self._build_page_guided()
-        self._build_page_stats()
 
         # ── Status bar ────────────────────────────────────────────────────
         self.status_bar = tk.Label(
@@ -600,7 +925,10 @@ class VocalRiyaaz:
         Return list of (x0, y0, x1, y1, midi, is_black) for every key
         in KEYBOARD_KEYS, in draw order (white first, then black on top).
         Origin is top-left of the canvas drawing area (below legend strip).
+        Built from class constants only, so computed once and cached.
         """
+        if self._key_rects is not None:
+            return self._key_rects
         WW, WH = self._WK_W, self._WK_H
         BW, BH = self._BK_W, self._BK_H
         Y_TOP  = 44     # pixels from top of canvas to top of keys (legend space)
@@ -642,16 +970,89 @@ class VocalRiyaaz:
                 x0 = oct_c_x + self._BK_OFFSETS[pc]
                 rects_black.append((x0, Y_TOP, x0+BW, Y_TOP+BH, midi, True))
 
-        return rects_white, rects_black
+        # Gather x positions of white keys for the range bands / octave labels
+        self._key_x = {r[4]: r[0] for r in rects_white}
+        if rects_white:
+            self._key_x['right'] = rects_white[-1][2]
+        self._key_white_midi = [r[4] for r in rects_white]
+        self._key_black_x    = [r[0] for r in rects_black]
+        self._key_rects = (rects_white, rects_black)
+        return self._key_rects
+
+    def _kb_key_style(self, midi, is_black, sel):
+        """(rect config, note-name fill, octave fill) for one key."""
+        C = self.C
+        male_lo_midi,   male_hi_midi   = self.RANGE_MALE_SA
+        female_lo_midi, female_hi_midi = self.RANGE_FEMALE_SA
+        # Range background tint
+        in_male   = male_lo_midi   <= midi <= male_hi_midi
+        in_female = female_lo_midi <= midi <= female_hi_midi
+
+        if is_black:
+            if sel:
+                fill = C['amber']; outline = C['saffron']
+            elif in_male:
+                fill = '#0a1f2a'; outline = '#006688'
+            elif in_female:
+                fill = '#2a1800'; outline = '#cc7700'
+            else:
+                fill = '#181818'; outline = '#404040'
+            return ({'fill': fill, 'outline': outline},
+                    '#aaaaaa' if not sel else '#000', None)
+
+        if sel:
+            fill = C['saffron']
+            txt_col = '#000000'
+        elif in_male and in_female:
+            fill = '#1a2010'; txt_col = C['muted']
+        elif in_male:
+            fill = '#081820'; txt_col = C['muted']
+        elif in_female:
+            fill = '#201400'; txt_col = C['muted']
+        else:
+            fill = '#e8e0d0'; txt_col = '#333333'
+        return ({'fill': fill},
+                txt_col if not sel else '#000', txt_col if not sel else '#333')
 
     def _draw_keyboard(self, canvas, selected_midi):
-        """Render the full keyboard onto `canvas`."""
+        """
+        Render the full keyboard onto `canvas`.  Every key is created once;
+        later calls only restyle the previously and newly selected keys.
+        """
+        WW, WH = self._WK_W, self._WK_H
+        Y_TOP  = 44
+
+        if self._kb_items is None or self._kb_items[0] is not canvas:
+            self._kb_build(canvas)
+        _, keys, freq_lbl = self._kb_items
+        if self._kb_sel == selected_midi:
+            return
+
+        for midi, sel in ((self._kb_sel, False), (selected_midi, True)):
+            if midi not in keys:
+                continue
+            rect, name_id, oct_id, is_black = keys[midi]
+            rect_kw, name_fill, oct_fill = self._kb_key_style(midi, is_black, sel)
+            canvas.itemconfigure(rect, **rect_kw)
+            canvas.itemconfigure(name_id, fill=name_fill)
+            if oct_id is not None:
+                canvas.itemconfigure(oct_id, fill=oct_fill)
+        self._kb_sel = selected_midi
+
+        # Frequency label below the selected key (white keys only)
+        if selected_midi in keys and not keys[selected_midi][3]:
+            x0 = self._key_x[selected_midi]
+            canvas.coords(freq_lbl, x0 + (WW-1)//2, Y_TOP + WH + 14)
+            canvas.itemconfigure(freq_lbl, state='normal',
+                text=f"{self._midi_table[selected_midi][2]:.1f}")
+        else:
+            canvas.itemconfigure(freq_lbl, state='hidden')
+
+    def _kb_build(self, canvas):
+        """Create every legend, key and label item with no key selected."""
         C   = self.C
         canvas.delete("all")
-        w   = canvas.winfo_width()
-        h   = canvas.winfo_height()
-        WW, WH = self._WK_W, self._WK_H
-        BW, BH = self._BK_W, self._BK_H
+        WW     = self._WK_W
         Y_TOP  = 44
 
         rects_white, rects_black = self._piano_key_rects()
@@ -661,14 +1062,7 @@ class VocalRiyaaz:
         male_lo_midi,   male_hi_midi   = self.RANGE_MALE_SA
         female_lo_midi, female_hi_midi = self.RANGE_FEMALE_SA
 
-        # Gather x positions of range boundary keys for the bands
-        midi_to_x = {}
-        for x0,y0,x1,y1,midi,_ in rects_white:
-            midi_to_x[midi] = x0
-        # Also get right edge of last white key
-        if rects_white:
-            last = rects_white[-1]
-            midi_to_x['right'] = last[2]
+        midi_to_x = self._key_x
 
         def _band_x(midi):
             # nearest white key x at or before midi
@@ -696,82 +1090,58 @@ class VocalRiyaaz:
                                    text=f"Oct {oct_}", fill=C['muted'],
                                    font=("Verdana",7))
 
+        keys = {}   # midi → (rect id, name text id, octave text id | None, is_black)
+
         # ── White keys ───────────────────────────────────────────────────
         for x0,y0,x1,y1,midi,_ in rects_white:
-            pc   = (midi - 60) % 12
-            name = self._note_names[pc] if hasattr(self,'_note_names') else ''
-            sel  = (midi == selected_midi)
-
-            # Range background tint
-            in_male   = male_lo_midi   <= midi <= male_hi_midi
-            in_female = female_lo_midi <= midi <= female_hi_midi
-
-            if sel:
-                fill = C['saffron']
-                txt_col = '#000000'
-            elif in_male and in_female:
-                fill = '#1a2010'; txt_col = C['muted']
-            elif in_male:
-                fill = '#081820'; txt_col = C['muted']
-            elif in_female:
-                fill = '#201400'; txt_col = C['muted']
-            else:
-                fill = '#e8e0d0'; txt_col = '#333333'
-
-            canvas.create_rectangle(x0, y0, x1, y1,
-                fill=fill, outline='#555555', width=1)
+            rect_kw, name_fill, oct_fill = self._kb_key_style(midi, False, False)
+            rect = canvas.create_rectangle(x0, y0, x1, y1,
+                outline='#555555', width=1, **rect_kw)
 
             # Note name
-            _note_display = self._note_names[(midi-60)%12] if True else ''
-            oct_num = midi//12 - 1
-            canvas.create_text((x0+x1)//2, y1-22,
-                text=_note_display, fill=txt_col if not sel else '#000',
+            _note_display, oct_num, _, _ = self._midi_table[midi]
+            name_id = canvas.create_text((x0+x1)//2, y1-22,
+                text=_note_display, fill=name_fill,
                 font=("Georgia",8,"bold"))
-            canvas.create_text((x0+x1)//2, y1-10,
-                text=str(oct_num), fill=txt_col if not sel else '#333',
+            oct_id = canvas.create_text((x0+x1)//2, y1-10,
+                text=str(oct_num), fill=oct_fill,
                 font=("Courier New",6))
+            keys[midi] = (rect, name_id, oct_id, False)
 
-            # Frequency label below key if in range
-            freq = self.midi_to_hz(midi)
-            if sel:
-                canvas.create_text((x0+x1)//2, y1+14,
-                    text=f"{freq:.1f}", fill=C['saffron'],
-                    font=("Courier New",7,"bold"))
+        # Frequency label below the selected key — one item, moved on select
+        freq_lbl = canvas.create_text(0, 0, fill=C['saffron'],
+            font=("Courier New",7,"bold"), state='hidden')
 
         # ── Black keys (drawn on top) ─────────────────────────────────
         for x0,y0,x1,y1,midi,_ in rects_black:
-            pc  = (midi - 60) % 12
-            sel = (midi == selected_midi)
-            in_male   = male_lo_midi   <= midi <= male_hi_midi
-            in_female = female_lo_midi <= midi <= female_hi_midi
-
-            if sel:
-                fill = C['amber']
-                outline = C['saffron']
-            elif in_male:
-                fill = '#0a1f2a'; outline = '#006688'
-            elif in_female:
-                fill = '#2a1800'; outline = '#cc7700'
-            else:
-                fill = '#181818'; outline = '#404040'
-
-            canvas.create_rectangle(x0, y0, x1, y1,
-                fill=fill, outline=outline, width=1)
+            rect_kw, name_fill, _ = self._kb_key_style(midi, True, False)
+            rect = canvas.create_rectangle(x0, y0, x1, y1, width=1, **rect_kw)
 
             # Note name on black key (tiny)
-            _note_display = self._note_names[(midi-60)%12]
-            canvas.create_text((x0+x1)//2, y1-12,
-                text=_note_display.replace('#','#'), fill='#aaaaaa' if not sel else '#000',
+            name_id = canvas.create_text((x0+x1)//2, y1-12,
+                text=self._midi_table[midi][0], fill=name_fill,
                 font=("Verdana",6))
+            keys[midi] = (rect, name_id, None, True)
+
+        self._kb_items = (canvas, keys, freq_lbl)
+        self._kb_sel   = None
 
     def _piano_midi_at(self, canvas_x, canvas_y):
-        """Return MIDI number of the key at pixel (canvas_x, canvas_y), or None."""
+        """
+        Return MIDI number of the key at pixel (canvas_x, canvas_y), or None.
+        Black keys are found by bisecting their sorted left edges; white keys
+        tile the row at _WK_W pixels, so their column is a single division.
+        """
         rects_white, rects_black = self._piano_key_rects()
         # Check black keys first (they sit on top)
-        for x0,y0,x1,y1,midi,_ in rects_black:
-            if x0 <= canvas_x <= x1 and y0 <= canvas_y <= y1:
+        k = bisect_right(self._key_black_x, canvas_x) - 1
+        if k >= 0:
+            x0,y0,x1,y1,midi,_ = rects_black[k]
+            if canvas_x <= x1 and y0 <= canvas_y <= y1:
                 return midi
-        for x0,y0,x1,y1,midi,_ in rects_white:
+        col = int(canvas_x // self._WK_W)
+        if 0 <= col < len(rects_white):
+            x0,y0,x1,y1,midi,_ = rects_white[col]
             if x0 <= canvas_x <= x1 and y0 <= canvas_y <= y1:
                 return midi
         return None
@@ -804,10 +1174,9 @@ class VocalRiyaaz:
         disp_row = tk.Frame(pg, bg=C['bg'])
         disp_row.pack(fill=tk.X, padx=28, pady=(4,10))
 
-        disp_card_outer = tk.Frame(disp_row, bg=C['border'], padx=1, pady=1)
-        disp_card_outer.pack(side=tk.LEFT)
-        disp_card = tk.Frame(disp_card_outer, bg=C['card'], padx=28, pady=14)
-        disp_card.pack()
+        disp_card = tk.Frame(disp_row, bg=C['card'], padx=28, pady=14,
+                             **self._card_border)
+        disp_card.pack(side=tk.LEFT)
 
         self._kb_note_big = tk.Label(disp_card, text="A3",
                                      font=("Georgia",44,"bold"),
@@ -839,14 +1208,14 @@ class VocalRiyaaz:
             text="🔊  Preview Note",
             command=self._kb_preview,
             bg=C['border'], fg=C['text'], font=("Verdana",10,"bold"),
-            relief=tk.FLAT, cursor="hand2", padx=16, pady=9)
+            padx=16, pady=9, **self._btn_kw)
         self._kb_preview_btn.pack(pady=4)
 
         self._kb_confirm_btn = tk.Button(btn_col,
             text="✅  Confirm — This is My Sa",
             command=self._kb_confirm,
             bg=C['saffron'], fg='black', font=("Verdana",11,"bold"),
-            relief=tk.FLAT, cursor="hand2", padx=16, pady=10)
+            padx=16, pady=10, **self._btn_kw)
         self._kb_confirm_btn.pack(pady=4)
 
         self._kb_confirm_fb = tk.Label(btn_col, text="",
@@ -861,18 +1230,16 @@ class VocalRiyaaz:
         kb_canvas_w = n_white * self._WK_W + 4
         kb_canvas_h = self._WK_H + 44 + 24   # legend + keys + freq labels
 
-        kb_outer = tk.Frame(pg, bg=C['border'], padx=1, pady=1)
-        kb_outer.pack(padx=28, pady=4)
-
-        self._kb_canvas = tk.Canvas(kb_outer,
+        self._kb_canvas = tk.Canvas(pg,
                                     width=kb_canvas_w, height=kb_canvas_h,
-                                    bg=C['card'], highlightthickness=0)
-        self._kb_canvas.pack()
+                                    bg=C['card'], **self._card_border)
+        self._kb_canvas.pack(padx=28, pady=4)
 
         # Bind click and draw initial state
         self._kb_canvas.bind("<Button-1>", self._kb_click)
         self._kb_canvas.bind("<Configure>",
-            lambda e: self._draw_keyboard(self._kb_canvas, self.selected_sa_midi))
+            lambda e: self._schedule_redraw('keyboard', lambda: self._draw_keyboard(
+                self._kb_canvas, self.selected_sa_midi)))
 
         self.root.after(100, lambda: self._draw_keyboard(
             self._kb_canvas, self.selected_sa_midi))
@@ -899,29 +1266,19 @@ class VocalRiyaaz:
         tk.Label(voice_row, text="Quick jump →",
                  font=("Verdana",9), fg=C['muted'], bg=C['bg']).pack(side=tk.LEFT, padx=(0,10))
 
-        voice_presets = [
-            ("Bass    C3",  48), ("Baritone D3", 50), ("Baritone E3", 52),
-            ("Tenor   F3",  53), ("Tenor   G3",  55),
-            ("Mezzo   A3",  57), ("Mezzo   B3",  59),
-            ("Soprano C4",  60), ("Soprano D4",  62),
-        ]
-        for label, midi in voice_presets:
-            note_name = self._note_names[(midi-60)%12]
-            oct_num   = midi//12 - 1
-            hz        = self.midi_to_hz(midi)
+        preset_kw = dict(bg=C['border'], fg=C['label'], font=("Verdana",7),
+                         padx=6, pady=4, width=10, **self._btn_kw)
+        for label, midi in self.VOICE_PRESETS:
+            _, _, hz, key = self._midi_table[midi]
             tk.Button(voice_row,
-                text=f"{label}\n{note_name}{oct_num}  {hz:.0f}Hz",
+                text=f"{label}\n{key}  {hz:.0f}Hz",
                 command=lambda m=midi: self._kb_select(m, play=True),
-                bg=C['border'], fg=C['label'], font=("Verdana",7),
-                relief=tk.FLAT, cursor="hand2",
-                padx=6, pady=4, width=10
+                **preset_kw
             ).pack(side=tk.LEFT, padx=2)
 
         # ── Tips panel ────────────────────────────────────────────────
-        tips_outer = tk.Frame(pg, bg=C['border'], padx=1, pady=1)
-        tips_outer.pack(padx=28, pady=10, fill=tk.X)
-        tips = tk.Frame(tips_outer, bg=C['panel'], padx=22, pady=12)
-        tips.pack(fill=tk.X)
+        tips = tk.Frame(pg, bg=C['panel'], padx=22, pady=12, **self._card_border)
+        tips.pack(padx=28, pady=10, fill=tk.X)
         tk.Label(tips, text="Music theory note",
                  font=("Georgia",10,"bold"), fg=C['teal'], bg=C['panel']).pack(anchor=tk.W)
         for t in [
@@ -937,7 +1294,7 @@ class VocalRiyaaz:
         tk.Button(pg, text="→  Continue to Free Practice",
                   command=lambda: self._switch_page('free'),
                   bg=C['teal'], fg='black', font=("Verdana",11,"bold"),
-                  relief=tk.FLAT, cursor="hand2", padx=18, pady=9).pack(padx=28, pady=8, anchor=tk.W)
+                  padx=18, pady=9, **self._btn_kw).pack(padx=28, pady=8, anchor=tk.W)
 
     # ── Keyboard interaction callbacks ─────────────────────────────────────
 
@@ -947,7 +1304,7 @@ class VocalRiyaaz:
         self._kb_update_display(midi)
         self._draw_keyboard(self._kb_canvas, midi)
         if play:
-            self.play_note_tone(self.midi_to_hz(midi))
+            self.play_note_tone(self._midi_table[midi][2])
 
     def _kb_click(self, event):
         midi = self._piano_midi_at(event.x, event.y)
@@ -957,11 +1314,7 @@ class VocalRiyaaz:
     def _kb_update_display(self, midi):
         """Refresh the big display panel with info about the selected MIDI key."""
         C     = self.C
-        freq  = self.midi_to_hz(midi)
-        pc    = (midi - 60) % 12
-        name  = self._note_names[pc]
-        oct_  = midi // 12 - 1
-        label = f"{name}{oct_}"
+        name, oct_, freq, label = self._midi_table[midi]
 
         self._kb_note_big.config(text=label)
         self._kb_hz_lbl.config(text=f"{freq:.2f} Hz")
@@ -969,47 +1322,61 @@ class VocalRiyaaz:
             text=f"All sargam notes will be tuned relative to {label}")
 
         # Voice hint
+        hint, col_key = self._voice_hint[midi]
+        self._kb_voice_hint.config(text=hint, fg=C[col_key])
+
+        # Update the sa_finder_freq Tk variable so existing code still works
+        self.sa_finder_freq.set(freq)
+
+    def _voice_hint_for(self, midi):
+        """Classify one MIDI key against the voice ranges (builds _voice_hint)."""
+        _, _, freq, label = self._midi_table[midi]
         mlo, mhi = self.RANGE_MALE_SA
         flo, fhi = self.RANGE_FEMALE_SA
         if mlo <= midi <= mhi and flo <= midi <= fhi:
-            hint = f"Both male & female voices commonly use {label} as Sa"
-            col  = C['success']
+            return f"Both male & female voices commonly use {label} as Sa", 'success'
         elif mlo <= midi <= mhi:
-            hint = f"♂  Common for male voices  ({label} = {freq:.0f} Hz)"
-            col  = C['teal']
+            return f"♂  Common for male voices  ({label} = {freq:.0f} Hz)", 'teal'
         elif flo <= midi <= fhi:
-            hint = f"♀  Common for female voices  ({label} = {freq:.0f} Hz)"
-            col  = C['warning']
+            return f"♀  Common for female voices  ({label} = {freq:.0f} Hz)", 'warning'
         elif midi < mlo:
-            hint = f"Deep bass range — {label} is below most singing Sa positions"
-            col  = C['muted']
+            return f"Deep bass range — {label} is below most singing Sa positions", 'muted'
         else:
-            hint = f"High range — {label} suits high soprano voices"
-            col  = C['muted']
-        self._kb_voice_hint.config(text=hint, fg=col)
-
-        # Update the sa_finder_freq Tk variable so existing code still works
-        self.sa_finder_freq.set(freq)
+            return f"High range — {label} suits high soprano voices", 'muted'
 
     def _kb_preview(self):
-        self.play_note_tone(self.midi_to_hz(self.selected_sa_midi))
+        self.play_note_tone(self._midi_table[self.selected_sa_midi][2])
 
     def _kb_confirm(self):
         C    = self.C
         midi = self.selected_sa_midi
-        freq = self.midi_to_hz(midi)
-        pc   = (midi - 60) % 12
-        name = self._note_names[pc]
-        oct_ = midi // 12 - 1
+        _, _, freq, label = self._midi_table[midi]
         self.set_sa(freq)
         self._kb_confirm_fb.config(
-            text=f"✅  Sa = {name}{oct_}  ({freq:.2f} Hz)\nAll notes updated!")
-        self.root.after(5000, lambda: self._kb_confirm_fb.config(text=""))
+            text=f"✅  Sa = {label}  ({freq:.2f} Hz)\nAll notes updated!")
+        if self._kb_confirm_job is not None:
+            self.root.after_cancel(self._kb_confirm_job)
+        self._kb_confirm_job = self.root.after(5000, self._kb_confirm_clear)
+
+    def _kb_confirm_clear(self):
+        self._kb_confirm_job = None
+        self._kb_confirm_fb.config(text="")
 
     # ═══════════════════════════════════════════════════════════════════════
     #  FREE PRACTICE PAGE
     # ═══════════════════════════════════════════════════════════════════════
 
+    def _sb_section(self, sidebar, text):
+        """Sidebar section header: rule and title drawn on one small canvas."""
+        C  = self.C
+        w  = int(sidebar.cget('width'))
+        cv = tk.Canvas(sidebar, bg=C['panel'], highlightthickness=0,
+                       width=w, height=19)
+        cv.create_line(12, 0, w-12, 0, fill=C['border'])
+        cv.create_text(14, 5, anchor=tk.NW, text=text, fill=C['teal'],
+                       font=("Verdana",8,"bold"))
+        cv.pack(fill=tk.X, pady=(14,6))
+
     def _build_page_free(self):
         C  = self.C
         pg = tk.Frame(self.page_host, bg=C['bg'])
@@ -1021,43 +1388,36 @@ class VocalRiyaaz:
         sidebar.pack_propagate(False)
         tk.Frame(pg, bg=C['border'], width=1).pack(side=tk.LEFT, fill=tk.Y)
 
-        def _sb_section(text):
-            tk.Frame(sidebar, bg=C['border'], height=1).pack(fill=tk.X, padx=12, pady=(14,0))
-            tk.Label(sidebar, text=text, font=("Verdana",8,"bold"),
-                     fg=C['teal'], bg=C['panel']).pack(anchor=tk.W, padx=14, pady=(4,6))
-
-        _sb_section("RECORDING")
+        self._sb_section(sidebar, "RECORDING")
         self.start_btn = tk.Button(sidebar, text="▶  START",
                                    command=self.start_analysis,
                                    bg=C['success'], fg='black',
-                                   font=("Verdana",11,"bold"), relief=tk.FLAT,
-                                   cursor="hand2", width=16, height=2)
+                                   font=("Verdana",11,"bold"),
+                                   width=16, height=2, **self._btn_kw)
         self.start_btn.pack(pady=3, padx=12)
         self.stop_btn  = tk.Button(sidebar, text="⏸  STOP",
                                    command=self.stop_analysis,
                                    bg=C['warning'], fg='black',
-                                   font=("Verdana",11,"bold"), relief=tk.FLAT,
-                                   cursor="hand2", width=16, height=2,
-                                   state=tk.DISABLED)
+                                   font=("Verdana",11,"bold"),
+                                   width=16, height=2, state=tk.DISABLED,
+                                   **self._btn_kw)
         self.stop_btn.pack(pady=3, padx=12)
 
-        _sb_section("SENSITIVITY")
+        self._sb_section(sidebar, "SENSITIVITY")
         tk.Label(sidebar, text="Mic level", font=("Verdana",7), fg=C['muted'],
                  bg=C['panel']).pack(anchor=tk.W, padx=14)
         tk.Scale(sidebar, from_=0.001, to=0.10, resolution=0.001,
-                 orient=tk.HORIZONTAL, variable=self.sensitivity_var,
-                 bg=C['panel'], fg=C['text'], highlightthickness=0,
-                 length=164, troughcolor=C['border'], showvalue=False).pack(padx=12)
+                 variable=self.sensitivity_var, length=164, showvalue=False,
+                 **self._scale_kw).pack(padx=12)
 
-        _sb_section("TOLERANCE")
+        self._sb_section(sidebar, "TOLERANCE")
         tk.Label(sidebar, text="Cents window", font=("Verdana",7), fg=C['muted'],
                  bg=C['panel']).pack(anchor=tk.W, padx=14)
-        tk.Scale(sidebar, from_=5, to=50, resolution=1, orient=tk.HORIZONTAL,
-                 variable=self.tolerance_var, bg=C['panel'], fg=C['text'],
-                 highlightthickness=0, length=164, troughcolor=C['border'],
+        tk.Scale(sidebar, from_=5, to=50, resolution=1,
+                 variable=self.tolerance_var, length=164, **self._scale_kw,
                  command=lambda v: setattr(self,'tolerance_cents',float(v))).pack(padx=12)
 
-        _sb_section("HOW TO USE")
+        self._sb_section(sidebar, "HOW TO USE")
         tk.Label(sidebar,
             text="1. Click a note to hear it\n"
                  "2. Sing and match the pitch\n"
@@ -1075,22 +1435,20 @@ class VocalRiyaaz:
         top.pack(fill=tk.X, padx=14, pady=10)
 
         # Glow circle (what you're currently singing)
-        glow_outer = tk.Frame(top, bg=C['border'], padx=1, pady=1)
-        glow_outer.pack(side=tk.LEFT)
-        self.free_glow = tk.Canvas(glow_outer, width=180, height=180,
-                                   bg=C['card'], highlightthickness=0)
-        self.free_glow.pack()
-        self.free_glow.bind('<Configure>', lambda e: self._draw_glow(self.free_glow, '--', 'idle'))
+        self.free_glow = tk.Canvas(top, width=180, height=180,
+                                   bg=C['card'], **self._card_border)
+        self.free_glow.pack(side=tk.LEFT)
+        self.free_glow.bind('<Configure>', lambda e: self._schedule_redraw(
+            'free_glow', lambda: self._draw_glow(self.free_glow, '--', 'idle')))
 
         # Info column
         info = tk.Frame(top, bg=C['bg'])
         info.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=14)
 
         def _card(parent, label, initial="--", color_key='text'):
-            outer = tk.Frame(parent, bg=C['border'], padx=1, pady=1)
-            outer.pack(fill=tk.X, pady=3)
-            inner = tk.Frame(outer, bg=C['card'], padx=14, pady=8)
-            inner.pack(fill=tk.X)
+            inner = tk.Frame(parent, bg=C['card'], padx=14, pady=8,
+                             **self._card_border)
+            inner.pack(fill=tk.X, pady=3)
             tk.Label(inner, text=label, font=("Verdana",8), fg=C['muted'],
                      bg=C['card']).pack(side=tk.LEFT)
             v = tk.Label(inner, text=initial, font=("Courier New",16,"bold"),
@@ -1123,34 +1481,39 @@ class VocalRiyaaz:
                  text="SARGAM KEYBOARD  —  click any note to hear it (harmonium tone)",
                  font=("Verdana",8,"bold"), fg=C['label'], bg=C['bg']).pack(side=tk.LEFT)
 
-        row1 = tk.Frame(right, bg=C['bg'])
-        row1.pack(fill=tk.X, padx=14, pady=2)
-        row2 = tk.Frame(right, bg=C['bg'])
-        row2.pack(fill=tk.X, padx=14, pady=2)
-
-        for name in self.MAIN_NOTES:
-            btn = tk.Button(row1, text=f"{name}\n--",
-                            font=("Georgia",9,"bold"), fg=C['text'],
-                            bg=C['border'], width=8, height=2,
-                            relief=tk.FLAT, cursor="hand2",
-                            command=lambda n=name: self.play_note_tone(n))
-            btn.pack(side=tk.LEFT, padx=2)
-            self.sargam_btns[name] = btn
-
-        for name in self.KOMAL_NOTES:
-            btn = tk.Button(row2, text=f"{name}\n--",
-                            font=("Georgia",9,"bold"), fg=C['muted'],
-                            bg=C['komal'], width=8, height=2,
-                            relief=tk.FLAT, cursor="hand2",
-                            command=lambda n=name: self.play_note_tone(n))
-            btn.pack(side=tk.LEFT, padx=2)
-            self.sargam_btns[name] = btn
+        # Both rows are items on one canvas; a click is mapped to its cell
+        # arithmetically in _sargam_click
+        SW, SH, SG = self._SG_W, self._SG_H, self._SG_GAP
+        self._sargam_rows = (self.MAIN_NOTES, self.KOMAL_NOTES)
+        cv = tk.Canvas(right, bg=C['bg'], highlightthickness=0, cursor="hand2",
+                       height=2*SH + 3*SG)
+        cv.pack(fill=tk.X, padx=14-SG)
+        for r, (names, fg, bg) in enumerate(((self.MAIN_NOTES,  C['text'],  C['border']),
+                                             (self.KOMAL_NOTES, C['muted'], C['komal']))):
+            y0 = SG + r*(SH + SG)
+            for c, name in enumerate(names):
+                x0   = SG + c*(SW + SG)
+                rect = cv.create_rectangle(x0, y0, x0+SW, y0+SH, fill=bg, outline='')
+                txt  = cv.create_text(x0 + SW//2, y0 + SH//2, text=f"{name}\n--",
+                                      fill=fg, font=("Georgia",9,"bold"),
+                                      justify=tk.CENTER)
+                self.sargam_btns[name] = (rect, txt)
+        cv.bind('<Button-1>', self._sargam_click)
+        self._sargam_canvas = cv
+
+        # Per-button lookup tables for the highlight pass in _free_update
+        self._btn_names        = list(self.sargam_btns)
+        self._btn_stripped_idx = np.array([self._stripped_index[n.rstrip("'")]
+                                           for n in self._btn_names])
+        self._btn_bg_def = [C['border'] if n in self.MAIN_NOTES else C['komal']
+                            for n in self._btn_names]
+        self._btn_fg_def = [C['text']   if n in self.MAIN_NOTES else C['muted']
+                            for n in self._btn_names]
+        self._btn_lit    = np.zeros(len(self._btn_names), dtype=bool)
 
         # Frequency history graph
-        graph_card_outer = tk.Frame(right, bg=C['border'], padx=1, pady=1)
-        graph_card_outer.pack(fill=tk.BOTH, expand=True, padx=14, pady=6)
-        graph_card = tk.Frame(graph_card_outer, bg=C['card'])
-        graph_card.pack(fill=tk.BOTH, expand=True)
+        graph_card = tk.Frame(right, bg=C['card'], **self._card_border)
+        graph_card.pack(fill=tk.BOTH, expand=True, padx=14, pady=6)
         tk.Label(graph_card, text="PITCH HISTORY",
                  font=("Verdana",7,"bold"), fg=C['muted'], bg=C['card'],
                  anchor=tk.W).pack(anchor=tk.W, padx=10, pady=(5,0))
@@ -1175,12 +1538,7 @@ class VocalRiyaaz:
         sidebar.pack_propagate(False)
         tk.Frame(pg, bg=C['border'], width=1).pack(side=tk.LEFT, fill=tk.Y)
 
-        def _sb_section(text):
-            tk.Frame(sidebar, bg=C['border'], height=1).pack(fill=tk.X, padx=12, pady=(14,0))
-            tk.Label(sidebar, text=text, font=("Verdana",8,"bold"),
-                     fg=C['teal'], bg=C['panel']).pack(anchor=tk.W, padx=14, pady=(4,6))
-
-        _sb_section("EXERCISE")
+        self._sb_section(sidebar, "EXERCISE")
         tk.Label(sidebar, text="Sequence", font=("Verdana",7), fg=C['muted'],
                  bg=C['panel']).pack(anchor=tk.W, padx=14)
         ttk.Combobox(sidebar, textvariable=self.selected_exercise,
@@ -1190,32 +1548,30 @@ class VocalRiyaaz:
         tk.Label(sidebar, text="Time per note (s)", font=("Verdana",7),
                  fg=C['muted'], bg=C['panel']).pack(anchor=tk.W, padx=14, pady=(8,0))
         tk.Scale(sidebar, from_=1.5, to=8.0, resolution=0.5,
-                 orient=tk.HORIZONTAL, variable=self.note_duration_var,
-                 bg=C['panel'], fg=C['text'], highlightthickness=0,
-                 length=170, troughcolor=C['border']).pack(padx=12)
+                 variable=self.note_duration_var, length=170,
+                 **self._scale_kw).pack(padx=12)
 
         tk.Label(sidebar, text="Mic sensitivity", font=("Verdana",7),
                  fg=C['muted'], bg=C['panel']).pack(anchor=tk.W, padx=14, pady=(8,0))
         tk.Scale(sidebar, from_=0.001, to=0.10, resolution=0.001,
-                 orient=tk.HORIZONTAL, variable=self.sensitivity_var,
-                 bg=C['panel'], fg=C['text'], highlightthickness=0,
-                 length=170, troughcolor=C['border'], showvalue=False).pack(padx=12)
+                 variable=self.sensitivity_var, length=170, showvalue=False,
+                 **self._scale_kw).pack(padx=12)
 
-        _sb_section("SESSION")
+        self._sb_section(sidebar, "SESSION")
         self.guided_start_btn = tk.Button(sidebar, text="▶  Start Session",
                                           command=self.start_guided_session,
                                           bg=C['success'], fg='black',
-                                          font=("Verdana",10,"bold"), relief=tk.FLAT,
-                                          cursor="hand2", width=17, height=2)
+                                          font=("Verdana",10,"bold"),
+                                          width=17, height=2, **self._btn_kw)
         self.guided_start_btn.pack(pady=4, padx=12)
         self.guided_stop_btn  = tk.Button(sidebar, text="⏹  Stop Session",
                                           command=self.stop_guided_session,
                                           bg=C['border'], fg=C['muted'],
-                                          font=("Verdana",9,"bold"), relief=tk.FLAT,
-                                          cursor="hand2", width=17, state=tk.DISABLED)
+                                          font=("Verdana",9,"bold"),
+                                          width=17, state=tk.DISABLED, **self._btn_kw)
         self.guided_stop_btn.pack(pady=3, padx=12)
 
-        _sb_section("HOW IT WORKS")
+        self._sb_section(sidebar, "HOW IT WORKS")
         tk.Label(sidebar,
             text="①  App plays the note\n"
                  "    on harmonium\n\n"
@@ -1235,14 +1591,13 @@ class VocalRiyaaz:
         hero.pack(fill=tk.X, padx=12, pady=10)
 
         # Target glow circle
-        glow_border = tk.Frame(hero, bg=C['border'], padx=1, pady=1)
-        glow_border.pack(side=tk.LEFT)
-        self.guided_glow_canvas = tk.Canvas(glow_border, width=190, height=190,
-                                            bg=C['card'], highlightthickness=0)
-        self.guided_glow_canvas.pack()
+        self.guided_glow_canvas = tk.Canvas(hero, width=190, height=190,
+                                            bg=C['card'], **self._card_border)
+        self.guided_glow_canvas.pack(side=tk.LEFT)
         self.guided_glow_canvas.bind(
             '<Configure>',
-            lambda e: self._draw_glow(self.guided_glow_canvas, '--', 'idle'))
+            lambda e: self._schedule_redraw('guided_glow', lambda: self._draw_glow(
+                self.guided_glow_canvas, '--', 'idle')))
 
         # Phase info panel
         info_panel = tk.Frame(hero, bg=C['bg'])
@@ -1305,10 +1660,8 @@ class VocalRiyaaz:
         bottom.pack(fill=tk.BOTH, expand=True, padx=12, pady=(2,6))
 
         # Left: frequency graph
-        graph_outer = tk.Frame(bottom, bg=C['border'], padx=1, pady=1)
-        graph_outer.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0,5))
-        graph_inner = tk.Frame(graph_outer, bg=C['card'])
-        graph_inner.pack(fill=tk.BOTH, expand=True)
+        graph_inner = tk.Frame(bottom, bg=C['card'], **self._card_border)
+        graph_inner.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0,5))
         tk.Label(graph_inner, text="YOUR PITCH HISTORY",
                  font=("Verdana",7,"bold"), fg=C['muted'], bg=C['card'],
                  anchor=tk.W).pack(anchor=tk.W, padx=8, pady=(5,0))
@@ -1317,11 +1670,10 @@ class VocalRiyaaz:
         self.guided_graph.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Right: results list
-        results_outer = tk.Frame(bottom, bg=C['border'], padx=1, pady=1, width=300)
-        results_outer.pack(side=tk.RIGHT, fill=tk.Y)
-        results_outer.pack_propagate(False)
-        results_inner = tk.Frame(results_outer, bg=C['card'])
-        results_inner.pack(fill=tk.BOTH, expand=True)
+        results_inner = tk.Frame(bottom, bg=C['card'], width=300,
+                                 **self._card_border)
+        results_inner.pack(side=tk.RIGHT, fill=tk.Y)
+        results_inner.pack_propagate(False)
         tk.Label(results_inner, text="NOTE RESULTS",
                  font=("Verdana",7,"bold"), fg=C['muted'], bg=C['card'],
                  anchor=tk.W).pack(anchor=tk.W, padx=8, pady=(5,0))
@@ -1344,15 +1696,14 @@ class VocalRiyaaz:
                  font=("Georgia",26,"bold"), fg=C['saffron'], bg=C['bg']).pack(side=tk.LEFT)
         tk.Button(head, text="🔄  Clear All", command=self._clear_stats,
                   bg=C['danger'], fg='white', font=("Verdana",9,"bold"),
-                  relief=tk.FLAT, cursor="hand2", padx=10, pady=5).pack(side=tk.RIGHT)
+                  padx=10, pady=5, **self._btn_kw).pack(side=tk.RIGHT)
 
-        card_outer = tk.Frame(pg, bg=C['border'], padx=1, pady=1)
-        card_outer.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0,16))
-        card = tk.Frame(card_outer, bg=C['card'])
-        card.pack(fill=tk.BOTH, expand=True)
+        card = tk.Frame(pg, bg=C['card'], **self._card_border)
+        card.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0,16))
         self.stats_canvas = tk.Canvas(card, bg=C['card'], highlightthickness=0)
         self.stats_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.stats_canvas.bind('<Configure>', lambda _: self._draw_stats())
+        self.stats_canvas.bind('<Configure>',
+            lambda _: self._schedule_redraw('stats', self._draw_stats))
 
     # ═══════════════════════════════════════════════════════════════════════
     #  PAGE SWITCHER
@@ -1360,10 +1711,13 @@ class VocalRiyaaz:
 
     def _switch_page(self, pid):
         C = self.C
-        pages = {'sa_setup':self.page_sa_setup, 'free':self.page_free,
-                 'guided':self.page_guided, 'stats':self.page_stats}
-        for p in pages.values(): p.pack_forget()
-        pages[pid].pack(fill=tk.BOTH, expand=True)
+        if pid not in self._built_pages:
+            self._page_builders[pid]()
+            self._built_pages.add(pid)
+        prev = self.current_page.get()
+        if prev != pid:
+            getattr(self, f'page_{prev}').pack_forget()
+        getattr(self, f'page_{pid}').pack(fill=tk.BOTH, expand=True)
         self.current_page.set(pid)
         for name, btn in self.nav_btns.items():
             if name == pid:
@@ -1381,146 +1735,220 @@ class VocalRiyaaz:
         """
         Centrepiece visual. Concentric rings create glow illusion.
         States: idle | listen | singing | hit | miss
+        The rings and texts are created once per canvas size; each call only
+        recolours and retexts them, and a repeat of the shown (state, note,
+        Hz) costs nothing.
         """
-        C = self.C
-        canvas.delete("all")
         w = canvas.winfo_width(); h = canvas.winfo_height()
         if w < 20 or h < 20:
             return
         cx, cy = w//2, h//2
-        r = min(w, h)//2 - 4
-
-        # Ring colours per state
-        states_cfg = {
-            'idle':    {'glow':['#0c0c20','#101028','#141432'],
-                        'face':'#101028', 'ring':'#252545', 'text':C['muted']},
-            'listen':  {'glow':['#041422','#06202e','#082a3a'],
-                        'face':'#071c2e', 'ring':C['teal'],  'text':C['teal']},
-            'singing': {'glow':['#1c1000','#261600','#301c00'],
-                        'face':'#201200', 'ring':C['saffron'],'text':C['saffron']},
-            'hit':     {'glow':['#001a08','#002814','#003520'],
-                        'face':'#001e0c', 'ring':C['success'],'text':C['success']},
-            'miss':    {'glow':['#1e0004','#280006','#320008'],
-                        'face':'#1c0004', 'ring':C['danger'], 'text':C['danger']},
-        }
-        cfg = states_cfg.get(state, states_cfg['idle'])
-
-        # Outer glow rings
-        for i, col in enumerate(cfg['glow']):
-            rr = r - i*6
-            canvas.create_oval(cx-rr, cy-rr, cx+rr, cy+rr, fill=col, outline='')
+        r  = min(w, h)//2 - 4
+        fr = r - 3*6 - 2
+
+        items = self._glow_items.get(canvas)
+        if items is None or items[0] != (w, h):
+            canvas.delete("all")
+            # Outer glow rings
+            rings = [canvas.create_oval(cx-(r-i*6), cy-(r-i*6),
+                                        cx+(r-i*6), cy+(r-i*6), outline='')
+                     for i in range(3)]
+            # Face circle
+            face  = canvas.create_oval(cx-fr, cy-fr, cx+fr, cy+fr, width=2)
+            note  = canvas.create_text(cx, cy)
+            hz    = canvas.create_text(cx, cy + fr - 20, font=("Courier New",8))
+            # Label at bottom edge
+            lbl   = canvas.create_text(cx, h - 10, font=("Verdana",7,"bold"))
+            items = self._glow_items[canvas] = [(w, h), rings, face, note, hz, lbl, None]
+        _, rings, face, note, hz, lbl, shown = items
+        if shown == (state, note_text, hz_text):
+            return
+        items[6] = (state, note_text, hz_text)
 
-        # Face circle
-        fr = r - len(cfg['glow'])*6 - 2
-        canvas.create_oval(cx-fr, cy-fr, cx+fr, cy+fr,
-                           fill=cfg['face'], outline=cfg['ring'], width=2)
+        cfg = self._glow_states.get(state, self._glow_states['idle'])
+        if shown is None or shown[0] != state:
+            for ring, col in zip(rings, cfg['glow']):
+                canvas.itemconfigure(ring, fill=col)
+            canvas.itemconfigure(face, fill=cfg['face'], outline=cfg['ring'])
+            canvas.itemconfigure(lbl, text=self._glow_labels.get(state, ''),
+                                 fill=cfg['ring'])
 
         # Note name
         fs  = 48 if len(note_text) <= 3 else 34
         off = 10 if hz_text else 0
-        canvas.create_text(cx, cy - off,
-                           text=note_text if note_text != '--' else '·',
-                           font=("Georgia", fs, "bold"), fill=cfg['text'])
-        if hz_text:
-            canvas.create_text(cx, cy + fr - 20,
-                               text=hz_text, font=("Courier New",8),
-                               fill=cfg['ring'])
-
-        # Label at bottom edge
-        state_labels = {'listen':'LISTEN', 'singing':'SING NOW',
-                        'hit':'✓  HIT', 'miss':'✗  MISS', 'idle':''}
-        lbl = state_labels.get(state, '')
-        if lbl:
-            canvas.create_text(cx, h - 10, text=lbl,
-                               font=("Verdana",7,"bold"), fill=cfg['ring'])
+        canvas.coords(note, cx, cy - off)
+        canvas.itemconfigure(note, text=note_text if note_text != '--' else '·',
+                             font=("Georgia", fs, "bold"), fill=cfg['text'])
+        canvas.itemconfigure(hz, text=hz_text, fill=cfg['ring'])
 
     # ── Pitch meter ────────────────────────────────────────────────────────
 
     def _draw_tuner(self, canvas, cents):
+        """
+        The zones, scale and centre line are drawn once per canvas size;
+        each frame only moves the needle bar and its label, and skips even
+        that when the needle would land where it already is.
+        """
         C = self.C
-        canvas.delete("all")
         w = canvas.winfo_width(); h = canvas.winfo_height()
         if w < 10: return
-        mid = w // 2
-
-        # Colour zones
-        zones = [(0,w*.20,'#1e0003'),(w*.20,w*.38,'#1a1200'),
-                 (w*.38,w*.62,'#001a06'),(w*.62,w*.80,'#1a1200'),
-                 (w*.80,w,'#1e0003')]
-        for x0,x1,col in zones:
-            canvas.create_rectangle(x0,0,x1,h, fill=col, outline='')
-
-        canvas.create_line(mid,0,mid,h, fill=C['success'], width=2)
-
-        for lbl,off in [("−50",-.5),("−25",-.25),("0",0),("+25",.25),("+50",.5)]:
-            x = mid + off*w
-            canvas.create_text(x,8, text=lbl, fill='#444466', font=("Courier New",7))
-            canvas.create_line(x,14,x,20, fill='#333355', width=1)
-
-        if cents is not None:
-            cl  = max(-50, min(50, cents))
-            nx  = mid + (cl/50)*(w*.5)
-            col = (C['success'] if abs(cents)<5 else
-                   C['warning'] if abs(cents)<15 else C['danger'])
-            canvas.create_rectangle(nx-4,18,nx+4,h-4, fill=col, outline='')
-            canvas.create_text(nx, h-10, text=f"{cents:+.0f}¢",
-                               fill=col, font=("Courier New",8,"bold"))
+        mid   = w // 2
+        items = self._tuner_items.get(canvas)
+        if items is None or items[:2] != [w, h]:
+            canvas.delete("all")
+            # Colour zones
+            zones = [(0,w*.20,'#1e0003'),(w*.20,w*.38,'#1a1200'),
+                     (w*.38,w*.62,'#001a06'),(w*.62,w*.80,'#1a1200'),
+                     (w*.80,w,'#1e0003')]
+            for x0,x1,col in zones:
+                canvas.create_rectangle(x0,0,x1,h, fill=col, outline='')
+
+            canvas.create_line(mid,0,mid,h, fill=C['success'], width=2)
+
+            for lbl,off in [("−50",-.5),("−25",-.25),("0",0),("+25",.25),("+50",.5)]:
+                x = mid + off*w
+                canvas.create_text(x,8, text=lbl, fill='#444466', font=("Courier New",7))
+                canvas.create_line(x,14,x,20, fill='#333355', width=1)
+
+            bar = canvas.create_rectangle(0,0,0,0, outline='', state='hidden')
+            txt = canvas.create_text(0,0, font=("Courier New",8,"bold"), state='hidden')
+            items = self._tuner_items[canvas] = [w, h, bar, txt, None]
+        bar, txt, shown = items[2:]
+
+        if cents is None:
+            if shown is not None:
+                items[4] = None
+                canvas.itemconfigure(bar, state='hidden')
+                canvas.itemconfigure(txt, state='hidden')
+            return
+        cl  = max(-50, min(50, cents))
+        nx  = mid + (cl/50)*(w*.5)
+        a   = abs(cents)
+        col = self._status_colors[(a<15) + (a<5)]
+        # A held note often lands on the same pixel, label and colour
+        sig = (round(nx), f"{cents:+.0f}¢", col)
+        if sig == shown:
+            return
+        items[4] = sig
+        canvas.coords(bar, nx-4,18,nx+4,h-4)
+        canvas.coords(txt, nx, h-10)
+        canvas.itemconfigure(bar, fill=col, state='normal')
+        canvas.itemconfigure(txt, text=sig[1], fill=col, state='normal')
 
     # ── Frequency graph ────────────────────────────────────────────────────
 
+    # Pitch-line glow passes, widest first: (colour, width)
+    _GLOW_PASSES = (("#00aac8",10), ("#00768c",7), ("#004450",4), ("#002228",2))
+
     def _draw_graph(self, canvas):
+        """
+        Glow lines, dots and gridlines are persistent items moved with
+        coords(); everything is recreated only when the canvas size or Sa
+        changes.
+        """
         C = self.C
-        canvas.delete("all")
-        if len(self.freq_history) < 2: return
         w = canvas.winfo_width(); h = canvas.winfo_height()
-        if w < 10 or h < 10: return
-
-        freqs = list(self.freq_history)
-        lo = min(freqs)-20; hi = max(freqs)+20; span = hi-lo
-        if span < 1: return
-
-        def fy(f): return h - h*(f-lo)/span
+        freqs = self._fh_ordered()
+        if self._fh_filled < 2 or w < 10 or h < 10:
+            canvas.delete("all"); self._graph_items.pop(canvas, None)
+            return
+        lo = float(freqs.min())-20; hi = float(freqs.max())+20; span = hi-lo
+        if span < 1:
+            canvas.delete("all"); self._graph_items.pop(canvas, None)
+            return
 
-        # Sargam gridlines (dashed) — current Sa
-        for n in self.indian_notes:
-            for mult in (0.5, 1.0, 2.0):
-                t = self.get_note_freq(n['name']) * mult
-                if lo <= t <= hi:
-                    y    = fy(t)
-                    is_sa = n['name'] in ('Sa',"Sa'")
-                    canvas.create_line(0,y,w,y,
+        items = self._graph_items.get(canvas)
+        if items is None or items['size'] != (w, h):
+            canvas.delete("all")
+            lines = [canvas.create_line(0,0,0,0, fill=col, width=thick)
+                     for col, thick in self._GLOW_PASSES]
+            top  = canvas.create_line(0,0,0,0, fill=C['teal'], width=1.5, smooth=True)
+            items = self._graph_items[canvas] = {
+                'size': (w, h), 'grid': None, 'span': None, 'lines': lines, 'top': top,
+                'dots': [], 'hit': []}
+
+        # Sargam gridlines (dashed) and the horizontal Hz grid are created
+        # once per size / Sa; a new visible range only moves, shows or hides
+        # them and rewrites the five Hz labels.
+        if items['grid'] != self.sa_base:
+            items['grid'] = self.sa_base; items['span'] = None
+            canvas.delete("grid")
+            marks, tgt = [], []
+            for n in self.indian_notes:
+                is_sa = n['name'] in ('Sa',"Sa'")
+                for mult in (0.5, 1.0, 2.0):
+                    suf  = "₋" if mult==0.5 else ("'" if mult==2.0 else "")
+                    line = canvas.create_line(0,0,0,0,
                         fill='#28220a' if is_sa else '#141428',
-                        width=2 if is_sa else 1, dash=(4,4))
-                    suf = "₋" if mult==0.5 else ("'" if mult==2.0 else "")
-                    canvas.create_text(w-4,y-2,
+                        width=2 if is_sa else 1, dash=(4,4),
+                        state='hidden', tags="grid")
+                    text = canvas.create_text(0,0,
                         text=n['name'].rstrip("'")+suf,
                         anchor=tk.NE, fill='#2a3a28' if is_sa else '#1e2850',
-                        font=("Courier New",7))
-
-        # Horizontal grid
-        for i in range(5):
-            y = h*i/4
-            canvas.create_line(0,y,w,y, fill='#0c0c18', width=1)
-            canvas.create_text(4,y+2, text=f"{hi-span*i/4:.0f}",
-                               anchor=tk.NW, fill='#28284a', font=("Courier New",7))
-
-        # Frequency polyline with teal glow
-        pts = [x for i,f in enumerate(freqs)
-               for x in [w*i/(len(freqs)-1), fy(f)]]
-
-        if len(pts) >= 4:
-            for thick in (10,7,4,2):
-                a   = thick/10
-                col = f"#{int(0):02x}{int(170*a):02x}{int(200*a):02x}"
-                canvas.create_line(pts, fill=col, width=thick, smooth=True)
-            canvas.create_line(pts, fill=C['teal'], width=1.5, smooth=True)
-
-            for i,f in enumerate(freqs):
-                x = w*i/(len(freqs)-1); y = fy(f)
-                try:    hit = bool(self.match_history[i])
-                except: hit = False
-                canvas.create_oval(x-2,y-2,x+2,y+2,
-                    fill=C['success'] if hit else '#002030', outline='')
+                        font=("Courier New",7), state='hidden', tags="grid")
+                    marks.append((line, text))
+                    tgt.append(self.get_note_freq(n['name']) * mult)
+            hz = []
+            for i in range(5):
+                y = h*i/4
+                canvas.create_line(0,y,w,y, fill='#0c0c18', width=1, tags="grid")
+                hz.append(canvas.create_text(4,y+2, anchor=tk.NW, fill='#28284a',
+                                             font=("Courier New",7), tags="grid"))
+            canvas.tag_lower("grid")
+            items.update(marks=marks, tgt=np.array(tgt),
+                         vis=np.zeros(len(marks), dtype=bool), hz=hz, hz_txt=[None]*5)
+
+        if items['span'] != (lo, hi):
+            items['span'] = (lo, hi)
+            tgt, was = items['tgt'], items['vis']
+            vis = (tgt >= lo) & (tgt <= hi)
+            ys  = h - h*(tgt-lo)/span
+            for k in np.flatnonzero(vis | was).tolist():
+                line, text = items['marks'][k]
+                if vis[k]:
+                    y = float(ys[k])
+                    canvas.coords(line, 0,y,w,y); canvas.coords(text, w-4,y-2)
+                if vis[k] != was[k]:
+                    st = 'normal' if vis[k] else 'hidden'
+                    canvas.itemconfigure(line, state=st); canvas.itemconfigure(text, state=st)
+            items['vis'] = vis
+            for i, t in enumerate(items['hz']):
+                txt = f"{hi-span*i/4:.0f}"
+                if txt != items['hz_txt'][i]:
+                    items['hz_txt'][i] = txt
+                    canvas.itemconfigure(t, text=txt)
+
+        # Frequency polyline with teal glow.
+        # Long histories are strided down to ≤120 points, and only the thin
+        # top line is spline-smoothed — the wide glow passes hide the corners.
+        n    = freqs.size
+        step = max(1, n//120)
+        idxs = np.arange(0, n, step)
+        xs   = w*idxs/(n-1)
+        ys   = h - h*(freqs[idxs]-lo)/span
+        pts  = np.column_stack((xs, ys)).ravel().tolist()
+        if len(pts) < 4:
+            return
+        for line in items['lines']:
+            canvas.coords(line, pts)
+        canvas.coords(items['top'], pts)
+
+        # Dots: grow the pool on demand, hide the surplus, recolour on change
+        hits = self._ring_ordered(self._mh, self._mh_i, self._mh_filled)
+        dots, shown_hit = items['dots'], items['hit']
+        while len(dots) < idxs.size:
+            dots.append(canvas.create_oval(0,0,0,0, fill='#002030', outline=''))
+            shown_hit.append(False)
+        for k, i in enumerate(idxs.tolist()):
+            x = pts[2*k]; y = pts[2*k+1]
+            canvas.coords(dots[k], x-2,y-2,x+2,y+2)
+            hit = i < hits.size and hits[i] != 0
+            if hit != shown_hit[k]:
+                shown_hit[k] = hit
+                canvas.itemconfigure(dots[k],
+                    fill=C['success'] if hit else '#002030')
+        for k in range(idxs.size, len(dots)):
+            canvas.coords(dots[k], -9,-9,-9,-9)
 
     # ── Guided results ─────────────────────────────────────────────────────
 
@@ -1549,69 +1977,108 @@ class VocalRiyaaz:
 
     # ── Stats bar chart ────────────────────────────────────────────────────
 
+    def _stat_add_cents(self, i, cents):
+        """Fold one cents error into note i's running mean (Welford update)."""
+        n = self._stat_n[i] + 1
+        self._stat_n[i]     = n
+        self._stat_mean[i] += (cents - self._stat_mean[i]) / n
+
     def _draw_stats(self):
-        C = self.C; c = self.stats_canvas; c.delete("all")
+        """
+        The chart frame is created once per canvas size and every note owns
+        a fixed set of bar / label items; a redraw only moves, retexts and
+        shows or hides them.
+        """
+        C = self.C; c = self.stats_canvas
         w = c.winfo_width(); h = c.winfo_height()
         if w < 10 or h < 10: return
 
-        note_names = [n['name'] for n in self.indian_notes if n['name'] != "Sa'"]
-        active = [(nm, self.note_stats[nm]) for nm in note_names
-                  if self.note_stats[nm]['hits']+self.note_stats[nm]['miss'] > 0]
-
-        if not active:
-            c.create_text(w//2, h//2,
-                text="No data yet.\n\nPractice in Free or Guided mode,\nthen return here to see your progress.",
-                fill=C['muted'], font=("Georgia",14), justify=tk.CENTER, anchor=tk.CENTER)
-            return
-
         mL=50; mR=20; mT=50; mB=70
         chart_h = int(h*0.52) - mT
+        yb      = mT + chart_h             # bar baseline
+        ty      = yb + 54                  # cents table title
 
-        c.create_text(w//2, 20,
-            text="Accuracy per Note  (% of attempts within tolerance)",
-            fill=C['teal'], font=("Georgia",13,"bold"), anchor=tk.CENTER)
-
-        for pct in [0,25,50,75,100]:
-            y = mT + chart_h - (chart_h*pct/100)
-            c.create_line(mL,y,w-mR,y, fill='#1a1a35', dash=(3,3))
-            c.create_text(mL-6,y, text=str(pct), fill=C['muted'],
-                          font=("Courier New",8), anchor=tk.E)
+        items = self._stats_items
+        if items is None or items['size'] != (w, h):
+            c.delete("all")
+            empty = c.create_text(w//2, h//2,
+                text="No data yet.\n\nPractice in Free or Guided mode,\nthen return here to see your progress.",
+                fill=C['muted'], font=("Georgia",14), justify=tk.CENTER, anchor=tk.CENTER,
+                state='hidden')
+
+            c.create_text(w//2, 20,
+                text="Accuracy per Note  (% of attempts within tolerance)",
+                fill=C['teal'], font=("Georgia",13,"bold"), anchor=tk.CENTER, tags="chart")
+            for pct in [0,25,50,75,100]:
+                y = mT + chart_h - (chart_h*pct/100)
+                c.create_line(mL,y,w-mR,y, fill='#1a1a35', dash=(3,3), tags="chart")
+                c.create_text(mL-6,y, text=str(pct), fill=C['muted'],
+                              font=("Courier New",8), anchor=tk.E, tags="chart")
+            c.create_text(w//2, ty,
+                text="Average Cents Off-pitch  (0 = perfect, lower is better)",
+                fill=C['saffron'], font=("Georgia",11,"bold"), anchor=tk.CENTER, tags="chart")
+
+            # Per note: glow, bar, pct, name, total | cents name, cents value
+            notes = []
+            for nm in self._stripped_index:
+                notes.append((
+                    c.create_rectangle(0,0,0,0, outline='', stipple='gray25', tags="note"),
+                    c.create_rectangle(0,0,0,0, outline='', tags="note"),
+                    c.create_text(0,0, font=("Verdana",7,"bold"), tags="note"),
+                    c.create_text(0,0, text=nm, fill=C['text'], font=("Georgia",9,"bold"), tags="note"),
+                    c.create_text(0,0, fill=C['muted'], font=("Courier New",7), tags="note"),
+                    c.create_text(0,0, text=nm, fill=C['text'], font=("Georgia",9,"bold"), tags="note"),
+                    c.create_text(0,0, font=("Courier New",9), tags="note")))
+            items = self._stats_items = {'size': (w, h), 'empty': empty, 'notes': notes}
+
+        counts  = self._stat_frames + self._stat_hits + self._stat_miss
+        active  = np.flatnonzero(counts).tolist()
+        w_hits  = self._stat_frames * self._frame_w + self._stat_hits
+        w_total = w_hits + self._stat_miss
+
+        c.itemconfigure("note", state='hidden')
+        if not active:
+            c.itemconfigure("chart", state='hidden')
+            c.itemconfigure(items['empty'], state='normal')
+            return
+        c.itemconfigure(items['empty'], state='hidden')
+        c.itemconfigure("chart", state='normal')
 
         bw = (w-mL-mR)//(len(active)+1)
-        for i,(nm,st) in enumerate(active):
-            total = st['hits']+st['miss']
-            pct   = st['hits']/total*100 if total else 0
-            x0    = mL + i*bw + 4; x1 = x0+bw-8
+        cw = (w-mL-mR)//len(active)
+        for i,k in enumerate(active):
+            glow, bar, pct_t, name_t, tot_t, cname_t, cval_t = items['notes'][k]
+            total = int(counts[k])
+            pct   = w_hits[k]/w_total[k]*100
+            x0    = mL + i*bw + 4; x1 = x0+bw-8; xm = (x0+x1)//2
             yt    = mT + chart_h - (chart_h*pct/100)
-            yb    = mT + chart_h
             col   = C['success'] if pct>=75 else C['warning'] if pct>=40 else C['danger']
-            # Glow bar
-            c.create_rectangle(x0-2,yt-2,x1+2,yb+2, fill=col, outline='', stipple='gray25')
-            c.create_rectangle(x0,yt,x1,yb, fill=col, outline='')
-            c.create_text((x0+x1)//2,yt-12, text=f"{pct:.0f}%",
-                          fill=col, font=("Verdana",7,"bold"))
-            c.create_text((x0+x1)//2,yb+14, text=nm,
-                          fill=C['text'], font=("Georgia",9,"bold"))
-            c.create_text((x0+x1)//2,yb+28, text=f"{total}",
-                          fill=C['muted'], font=("Courier New",7))
-
-        # Cents table
-        ty = mT + chart_h + 54
-        c.create_text(w//2, ty,
-            text="Average Cents Off-pitch  (0 = perfect, lower is better)",
-            fill=C['saffron'], font=("Georgia",11,"bold"), anchor=tk.CENTER)
-        ty += 22
-        cw  = (w-mL-mR)//max(1,len(active))
-        for i,(nm,st) in enumerate(active):
-            cl  = st.get('cents',[]); avg = float(np.mean(cl)) if cl else 0.0
+            c.coords(glow, x0-2,yt-2,x1+2,yb+2)
+            c.coords(bar,  x0,yt,x1,yb)
+            c.coords(pct_t,  xm,yt-12)
+            c.coords(name_t, xm,yb+14)
+            c.coords(tot_t,  xm,yb+28)
+            c.itemconfigure(glow,  fill=col, state='normal')
+            c.itemconfigure(bar,   fill=col, state='normal')
+            c.itemconfigure(pct_t, text=f"{pct:.0f}%", fill=col, state='normal')
+            c.itemconfigure(name_t, state='normal')
+            c.itemconfigure(tot_t, text=f"{total}", state='normal')
+
+            # Cents table
+            avg = float(self._stat_mean[k])
             col = C['success'] if abs(avg)<5 else C['warning'] if abs(avg)<15 else C['danger']
             x   = mL + i*cw + cw//2
-            c.create_text(x,ty,    text=nm,           fill=C['text'],  font=("Georgia",9,"bold"))
-            c.create_text(x,ty+16, text=f"{avg:+.1f}¢",fill=col, font=("Courier New",9))
+            c.coords(cname_t, x,ty+22)
+            c.coords(cval_t,  x,ty+38)
+            c.itemconfigure(cname_t, state='normal')
+            c.itemconfigure(cval_t, text=f"{avg:+.1f}¢", fill=col, state='normal')
 
     def _clear_stats(self):
         if messagebox.askyesno("Clear Stats","Clear all session statistics?"):
-            self.note_stats.clear(); self._draw_stats()
+            for a in (self._stat_frames, self._stat_hits, self._stat_miss,
+                      self._stat_n, self._stat_mean):
+                a.fill(0)
+            self._draw_stats()
 
     # ═══════════════════════════════════════════════════════════════════════
     #  AUDIO PIPELINE
@@ -1619,19 +2086,23 @@ class VocalRiyaaz:
 
     def start_analysis(self):
         try:
+            self._ring_w = self._ring_r = 0
             self.stream = self.p.open(format=self.FORMAT, channels=self.CHANNELS,
                                       rate=self.RATE, input=True,
-                                      frames_per_buffer=self.CHUNK)
+                                      frames_per_buffer=self.HOP,
+                                      stream_callback=self._in_cb)
             self.running = True
             # Separate queue for processed results (freq, matched, meter_cents, cents_err)
             # so the UI thread never blocks on YIN.
             self.result_queue = queue.Queue(maxsize=10)
+            self._last_frame_t = time.monotonic()
             try:
                 self.start_btn.config(state=tk.DISABLED)
                 self.stop_btn.config(state=tk.NORMAL)
             except Exception:
                 pass
             self.status_bar.config(text="Listening — sing!")
+            self._capture_done.clear()
             threading.Thread(target=self._audio_capture, daemon=True).start()
             self._poll_results()          # lightweight UI poller
         except Exception as e:
@@ -1639,6 +2110,7 @@ class VocalRiyaaz:
 
     def stop_analysis(self):
         self.running = False
+        self._ring_evt.set()              # wake the capture thread to exit
         self.guided_active = False
         self.guided_listen = False
         if self.stream:
@@ -1655,46 +2127,87 @@ class VocalRiyaaz:
             pass
         self.status_bar.config(text="Stopped")
 
+    def _in_cb(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio input callback — only copies samples into the ring.
+        No detection here, so the driver thread returns immediately.
+        """
+        x = np.frombuffer(in_data, dtype=np.float32)
+        L = self._ring.size
+        i = self._ring_w % L
+        n = min(len(x), L - i)
+        self._ring[i:i+n]       = x[:n]
+        self._ring[:len(x) - n] = x[n:]
+        self._ring_w += len(x)
+        self._ring_evt.set()
+        return (None, pyaudio.paContinue)
+
+    def _ring_latest(self, n):
+        """
+        Copy the newest n samples out of the ring (handles wrap-around) and
+        mark everything up to them as analysed.
+        """
+        w = self._ring_w
+        L = self._ring.size
+        i = (w - n) % L
+        if i + n <= L:
+            out = self._ring[i:i+n].copy()
+        else:
+            out = np.concatenate((self._ring[i:], self._ring[:i + n - L]))
+        self._ring_r = w
+        return out
+
     def _audio_capture(self):
         """
         Runs in a background thread.
-        Reads raw audio → runs YIN → smooths → pushes result dict to result_queue.
+        Drains the input ring → runs YIN → smooths → pushes result dict to result_queue.
         The UI thread never touches YIN.
         """
-        while self.running:
-            try:
-                if self.stream is None:
-                    break
-                raw  = self.stream.read(self.CHUNK, exception_on_overflow=False)
-                data = np.frombuffer(raw, dtype=np.float32).copy()
-
-                rms = float(np.sqrt(np.mean(data ** 2)))
-                if rms > self.sensitivity_var.get():
-                    raw_freq = self.detect_pitch_yin(data)    # heavy — lives here
-                    freq     = self._smooth(raw_freq)
-                    if 60 < freq < 1200:
-                        matched, cents_err = self.check_note_match(freq)
-                        meter_cents        = self._cents_from_nearest(freq)
-                        result = dict(freq=freq, matched=matched,
-                                      cents_err=cents_err,
-                                      meter_cents=meter_cents,
-                                      silent=False)
+        try:
+            while self.running:
+                try:
+                    if self.stream is None:
+                        break
+                    # Clear before checking, so a block landing in between
+                    # still wakes the wait below (timeout re-checks running)
+                    self._ring_evt.clear()
+                    # Analyse once per HOP of new audio, always over the
+                    # newest CHUNK window; a backlog is skipped, not replayed
+                    if self._ring_w - self._ring_r < self.HOP or self._ring_w < self.CHUNK:
+                        self._ring_evt.wait(self.HOP / self.RATE)
+                        continue
+                    data = self._ring_latest(self.CHUNK)
+
+                    rms = math.sqrt(float(np.dot(data, data)) / data.size)
+                    if rms > self._sensitivity:
+                        raw_freq = self.detect_pitch_yin(data)    # heavy — lives here
+                        freq     = self._smooth(raw_freq)
+                        if 60 < freq < 1200:
+                            matched, cents_err = self.check_note_match(freq)
+                            meter_cents        = self._cents_from_nearest(freq)
+                            result = dict(freq=freq, matched=matched,
+                                          cents_err=cents_err,
+                                          meter_cents=meter_cents,
+                                          silent=False)
+                        else:
+                            result = dict(silent=True)
                     else:
                         result = dict(silent=True)
-                else:
-                    result = dict(silent=True)
+                    result['t'] = time.monotonic()
 
-                # Drop oldest if full (prevents lag build-up)
-                if self.result_queue.full():
-                    try: self.result_queue.get_nowait()
-                    except queue.Empty: pass
-                self.result_queue.put(result)
+                    # Drop oldest if full (prevents lag build-up)
+                    if self.result_queue.full():
+                        try: self.result_queue.get_nowait()
+                        except queue.Empty: pass
+                    self.result_queue.put(result)
 
-            except OSError:
-                # Stream was closed — exit cleanly
-                break
-            except Exception as e:
-                print(f"Capture: {e}")
+                except OSError:
+                    # Stream was closed — exit cleanly
+                    break
+                except Exception as e:
+                    print(f"Capture: {e}")
+        finally:
+            self._capture_done.set()   # lets on_closing stop waiting
 
     def _poll_results(self):
         """
@@ -1706,85 +2219,186 @@ class VocalRiyaaz:
         try:
             result = self.result_queue.get_nowait()
         except queue.Empty:
-            self.root.after(30, self._poll_results)
+            self._schedule_poll()
             return
+        self._last_frame_t = result['t']
 
         if result.get('silent'):
             pg = self.current_page.get()
             if pg == 'free':
-                self._draw_glow(self.free_glow, '--', 'idle')
-            self.root.after(30, self._poll_results)
+                self._schedule_render(glow=(self.free_glow, '--', 'idle'))
+            self._schedule_poll()
             return
 
         freq        = result['freq']
         matched     = result['matched']
         cents_err   = result['cents_err']
         meter_cents = result['meter_cents']
-        now         = time.time()
+        now         = time.monotonic()
 
-        self.freq_history.append(freq)
+        pg = self.current_page.get()
+        # Pitch and hit rings are pushed together so their slots stay
+        # aligned; on the guided page only the target note counts as a hit
+        if pg == 'guided':
+            hit = matched is not None and self._label_base[matched] == self.guided_target_base
+        else:
+            hit = matched is not None
+        self._fh_push(freq)
+        self._mh_push(hit)
 
         # Update session stats
         if matched:
-            base = matched.rstrip("'₋")
-            self.note_stats[base]['hits'] += 1
+            base = self._label_base[matched]
+            self._stat_frames[base] += 1
             if cents_err is not None:
-                self.note_stats[base]['cents'].append(float(cents_err))
-            self.last_match_time[base] = now
+                self._stat_add_cents(base, cents_err)
+            self._last_match_arr[base] = now
 
-        pg = self.current_page.get()
         if pg == 'free':
             self._free_update(freq, matched, meter_cents, now)
         elif pg == 'guided':
             self._guided_voice_update(freq, matched, meter_cents, cents_err)
 
-        self.root.after(30, self._poll_results)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        """
+        Re-arm _poll_results for when the next capture frame is due — one
+        HOP period after the newest result, or 5 ms if it is already late.
+        """
+        period_ms = 1000.0 * self.HOP / self.RATE
+        wait_ms   = period_ms - 1000.0 * (time.monotonic() - self._last_frame_t)
+        self.root.after(max(5, int(wait_ms)), self._poll_results)
+
+    # ── Deferred widget updates ────────────────────────────────────────────
+
+    def _ui_set(self, widget, **kw):
+        """Queue a widget .config() for the next _flush_ui tick — latest value wins."""
+        self._pending.setdefault(widget, {}).update(kw)
+
+    def _flush_ui(self):
+        """
+        Apply queued widget changes 20× per second.  Options whose value is
+        already on screen are skipped, so a steady note costs no Tcl calls.
+        """
+        for w, kw in self._pending.items():
+            shown   = self._shown.setdefault(w, {})
+            changed = {k: v for k, v in kw.items() if shown.get(k) != v}
+            if changed:
+                w.configure(**changed)
+                shown.update(changed)
+        self._pending.clear()
+        self.root.after(50, self._flush_ui)
+
+    def _schedule_redraw(self, key, fn):
+        """
+        Debounce <Configure> redraws: a resize drag fires a burst of events,
+        so each one re-arms a 30 ms timer per canvas and only the last runs.
+        """
+        job = self._resize_jobs.get(key)
+        if job is not None:
+            self.root.after_cancel(job)
+        def run():
+            self._resize_jobs.pop(key, None)
+            fn()
+        self._resize_jobs[key] = self.root.after(30, run)
+
+    # Minimum seconds between redraws of each canvas element — the graph is
+    # the costliest and a pitch trail reads fine at 10 fps
+    RENDER_PERIOD = {'glow': 1/15, 'tuner': 1/20, 'graph': 1/10}
+
+    def _schedule_render(self, **draws):
+        """
+        Stash the newest args for each canvas element (glow / tuner / graph)
+        and make sure one _do_render is queued for when the earliest of them
+        is next allowed to redraw.  Superseded frames are never drawn.
+        """
+        self._render_args.update(draws)
+        if self._render_due or not self._render_args:
+            return
+        self._render_due = True
+        due     = min(self._last_render[k] + self.RENDER_PERIOD[k] for k in self._render_args)
+        wait_ms = int(1000 * (due - time.monotonic()))
+        if wait_ms > 0: self.root.after(wait_ms, self._do_render)
+        else:           self.root.after_idle(self._do_render)
+
+    def _do_render(self):
+        """Draw every element whose period has elapsed; re-queue the rest."""
+        self._render_due = False
+        now  = time.monotonic()
+        args = self._render_args
+        for k, draw in (('glow',  self._draw_glow),
+                        ('tuner', self._draw_tuner),
+                        ('graph', self._draw_graph)):
+            # 5 ms slack: after() rounds down to whole milliseconds
+            if k in args and now - self._last_render[k] >= self.RENDER_PERIOD[k] - 0.005:
+                draw(*args.pop(k))
+                self._last_render[k] = now
+        self._schedule_render()
 
     # ── Free practice update ───────────────────────────────────────────────
 
     def _free_update(self, freq, matched, meter_cents, now):
         C = self.C
-        self.free_freq_lbl.config(text=f"{freq:.1f} Hz")
+        self._ui_set(self.free_freq_lbl, text=f"{freq:.1f} Hz")
 
         if matched:
             glow_state = 'hit'
-            self.match_history.append(True)
-            clr = (C['success'] if abs(meter_cents)<5 else
-                   C['warning'] if abs(meter_cents)<15 else C['danger'])
-            self.free_cents_lbl.config(text=f"{meter_cents:+.0f}¢", fg=clr)
-            self.free_raga_lbl.config(text=matched, fg=C['saffron'])
+            a   = abs(meter_cents)
+            clr = self._status_colors[(a<15) + (a<5)]
+            self._ui_set(self.free_cents_lbl, text=f"{meter_cents:+.0f}¢", fg=clr)
+            self._ui_set(self.free_raga_lbl, text=matched, fg=C['saffron'])
         else:
             glow_state = 'singing'
-            self.match_history.append(False)
-            self.free_cents_lbl.config(text="--¢", fg=C['muted'])
-            self.free_raga_lbl.config(text="--", fg=C['muted'])
+            self._ui_set(self.free_cents_lbl, text="--¢", fg=C['muted'])
+            self._ui_set(self.free_raga_lbl, text="--", fg=C['muted'])
 
         note_display = matched if matched else "--"
-        self._draw_glow(self.free_glow, note_display, glow_state,
-                        hz_text=f"{freq:.1f} Hz")
 
         # Stability indicator
-        recent = list(self.freq_history)[-10:]
-        if len(recent) >= 4:
-            std  = np.std(recent)
-            stab = max(0, 100-int(std*5))
-            sc   = C['success'] if stab>80 else C['warning'] if stab>50 else C['danger']
-            self.free_stab_lbl.config(text=f"{stab}%", fg=sc)
-
-        # Button highlights
-        for name, btn in self.sargam_btns.items():
-            stripped = name.rstrip("'")
-            bg_def   = C['border'] if name in self.MAIN_NOTES else C['komal']
-            if now - self.last_match_time.get(stripped, 0.0) < self.note_hold_time:
-                btn.config(bg=C['success'], fg='black')
+        if self._stab_n >= 4:
+            std, stab = self._stab_stats()
+            sc   = self._status_colors[(stab>50) + (stab>80)]
+            self._ui_set(self.free_stab_lbl, text=f"{stab}%", fg=sc)
+
+        # Button highlights — one vectorised age test, then touch only the flips
+        lit = (now - self._last_match_arr[self._btn_stripped_idx]) < self.note_hold_time
+        cv  = self._sargam_canvas
+        for i in np.flatnonzero(lit != self._btn_lit):
+            rect, txt = self.sargam_btns[self._btn_names[i]]
+            if lit[i]:
+                cv.itemconfigure(rect, fill=C['success']); cv.itemconfigure(txt, fill='black')
             else:
-                btn.config(bg=bg_def, fg=C['text'] if name in self.MAIN_NOTES else C['muted'])
+                cv.itemconfigure(rect, fill=self._btn_bg_def[i])
+                cv.itemconfigure(txt,  fill=self._btn_fg_def[i])
+        self._btn_lit = lit
+
+        self._schedule_render(
+            glow=(self.free_glow, note_display, glow_state, f"{freq:.1f} Hz"),
+            tuner=(self.free_tuner, meter_cents),
+            graph=(self.free_graph,))
+        # Status text at most 5× per second, and only when it reads differently
+        # (a held note repeats it); the Sa part is prebuilt in set_sa
+        if now - self._last_status > 0.2:
+            self._last_status = now
+            txt = (f"Freq: {freq:.1f} Hz  |  {self._sa_prefix}"
+                   + (f"  |  ✓  {matched}" if matched else ""))
+            if txt != self._status_txt:
+                self._status_txt = txt
+                self.status_bar.config(text=txt)
+
+    # ── Scoring helpers ────────────────────────────────────────────────────
+
+    def _stab_stats(self):
+        """Return (std, stability %) of the newest STAB_N frequencies."""
+        std = math.sqrt(max(self._stab_m2, 0.0) / self._stab_n)
+        return std, max(0, 100 - int(std * 5))
 
-        self._draw_tuner(self.free_tuner, meter_cents)
-        self._draw_graph(self.free_graph)
-        self.status_bar.config(
-            text=f"Freq: {freq:.1f} Hz  |  Sa: {self.sa_base:.1f} Hz"
-                 + (f"  |  ✓  {matched}" if matched else ""))
+    @staticmethod
+    def _score_buf(buf, tol):
+        """Return (hit %, mean cents) for one guided note's float32 cents buffer."""
+        hits = int(np.count_nonzero(buf <= tol))
+        return hits / buf.size * 100, float(buf.mean())
 
     # ═══════════════════════════════════════════════════════════════════════
     #  GUIDED RIYAAZ ENGINE
@@ -1796,7 +2410,9 @@ class VocalRiyaaz:
             raga = self.selected_raga.get()
             pool = self.RAGAS.get(raga) or [n['name'] for n in self.indian_notes
                                              if n['name'] != "Sa'"]
-            return [random.choice(pool) for _ in range(8)]
+            if not pool:
+                return ['Sa']
+            return list(self._rng.choice(np.asarray(pool, dtype=object), size=8))
         return list(ex)
 
     def start_guided_session(self):
@@ -1828,11 +2444,19 @@ class VocalRiyaaz:
 
         C             = self.C
         note_name     = self.guided_sequence[self.guided_step]
-        target_freq   = self.get_note_freq(note_name)
+        target_id     = self._note_id[note_name]
+        target_freq   = self._note_freq[target_id]
         total         = len(self.guided_sequence)
 
-        self.guided_target    = note_name
-        self.guided_cents_buf = []
+        self.guided_target      = note_name
+        self.guided_target_id   = target_id
+        self.guided_target_base = int(self._note_base[target_id])
+        # Room for every frame from the LISTEN lead-in (1.75 s) to the end of
+        # the singing window, plus slack; _guided_cents_push doubles it if a
+        # late timer or a longer slider setting overruns that.
+        n_frames = (self._note_duration + 1.75) * self.RATE / self.HOP
+        self.guided_cents_buf = np.empty(int(n_frames) + 8, dtype=np.float32)
+        self.guided_cents_n   = 0
         self.guided_listen    = False
         self.guided_glow_state = 'listen'
 
@@ -1841,7 +2465,7 @@ class VocalRiyaaz:
         self.guided_phase_lbl.config(text="🎵  LISTEN ...", fg=C['teal'])
         self.guided_countdown.config(text="")
         self.guided_result_lbl.config(text="")
-        self.guided_singing_lbl.config(text="--", fg=C['muted'])
+        self._ui_set(self.guided_singing_lbl, text="--", fg=C['muted'])
         self.guided_progress.config(text=f"{self.guided_step+1} / {total}")
 
         self.play_note_tone(note_name)
@@ -1851,18 +2475,25 @@ class VocalRiyaaz:
         if not self.guided_active: return
         C = self.C
         self.guided_listen       = True
-        self.guided_listen_start = time.time()
+        self.guided_listen_start = self._ring_w
+        self.guided_listen_t0    = time.monotonic()
         self.guided_glow_state   = 'singing'
         self._draw_glow(self.guided_glow_canvas, self.guided_target, 'singing',
-                        hz_text=f"{self.get_note_freq(self.guided_target):.1f} Hz")
+                        hz_text=f"{self._note_freq[self.guided_target_id]:.1f} Hz")
         self.guided_phase_lbl.config(text="🎤  NOW SING!", fg=C['saffron'])
         self._guided_tick()
 
+    # Seconds past the singing window after which the wall clock ends it,
+    # even if no audio arrives (input stalled or device gone)
+    GUIDED_STALL_GRACE = 1.0
+
     def _guided_tick(self):
         if not self.guided_active or not self.guided_listen: return
-        elapsed   = time.time() - self.guided_listen_start
-        remaining = self.note_duration_var.get() - elapsed
-        if remaining <= 0:
+        # Timed in captured samples, so the window matches the audio scored
+        elapsed   = (self._ring_w - self.guided_listen_start) / self.RATE
+        remaining = self._note_duration - elapsed
+        wall      = time.monotonic() - self.guided_listen_t0
+        if remaining <= 0 or wall >= self._note_duration + self.GUIDED_STALL_GRACE:
             self._guided_end_sing(); return
         self.guided_countdown.config(text=f"{remaining:.1f}s")
         self.root.after(100, self._guided_tick)
@@ -1871,12 +2502,10 @@ class VocalRiyaaz:
         C  = self.C
         self.guided_listen = False
         self.guided_countdown.config(text="")
-        buf = self.guided_cents_buf
+        buf = self.guided_cents_buf[:self.guided_cents_n]
 
-        if buf:
-            hit_frames = [c for c in buf if c <= self.tolerance_cents]
-            hit_pct    = len(hit_frames)/len(buf)*100
-            avg_cents  = float(np.mean(buf))
+        if buf.size:
+            hit_pct, avg_cents = self._score_buf(buf, self.tolerance_cents)
             hit        = hit_pct >= 55
             if   hit_pct >= 80:
                 txt = f"✅  Excellent!  {hit_pct:.0f}% on pitch  |  avg {avg_cents:.0f}¢ off"
@@ -1896,13 +2525,12 @@ class VocalRiyaaz:
             col  = C['warning']
 
         self._draw_glow(self.guided_glow_canvas, self.guided_target, gs,
-                        hz_text=f"{self.get_note_freq(self.guided_target):.1f} Hz")
+                        hz_text=f"{self._note_freq[self.guided_target_id]:.1f} Hz")
         self.guided_result_lbl.config(text=txt, fg=col)
         self.guided_phase_lbl.config(text="")
 
-        base = self.guided_target.rstrip("'")
-        if hit: self.note_stats[base]['hits'] += 1
-        else:   self.note_stats[base]['miss'] += 1
+        if hit: self._stat_hits[self.guided_target_base] += 1
+        else:   self._stat_miss[self.guided_target_base] += 1
 
         self.guided_results.append(
             {'note':self.guided_target,'hit':hit,'hit_pct':hit_pct,'avg_cents':avg_cents})
@@ -1915,23 +2543,29 @@ class VocalRiyaaz:
         """Called from audio loop during the singing window."""
         C = self.C
         if matched:
-            base_match  = matched.rstrip("'₋")
-            base_target = (self.guided_target or '').rstrip("'")
-            correct     = base_match == base_target
+            correct = self._label_base[matched] == self.guided_target_base
             if correct:
-                self.guided_singing_lbl.config(text=matched, fg=C['success'])
+                self._ui_set(self.guided_singing_lbl, text=matched, fg=C['success'])
                 if cents_err is not None:
-                    self.guided_cents_buf.append(float(cents_err))
+                    self._guided_cents_push(cents_err)
             else:
-                self.guided_singing_lbl.config(text=matched, fg=C['danger'])
-                self.guided_cents_buf.append(float(self.tolerance_cents + 20))
-            self.match_history.append(correct)
+                self._ui_set(self.guided_singing_lbl, text=matched, fg=C['danger'])
+                self._guided_cents_push(self.tolerance_cents + 20)
         else:
-            self.guided_singing_lbl.config(text="--", fg=C['muted'])
-            self.match_history.append(False)
+            self._ui_set(self.guided_singing_lbl, text="--", fg=C['muted'])
 
-        self._draw_tuner(self.guided_tuner, meter_cents)
-        self._draw_graph(self.guided_graph)   # ← Graph always visible in guided
+        self._schedule_render(tuner=(self.guided_tuner, meter_cents),
+                              graph=(self.guided_graph,))   # ← Graph always visible in guided
+
+    def _guided_cents_push(self, cents):
+        """Append one frame's cents error, doubling the buffer when it is full."""
+        buf, n = self.guided_cents_buf, self.guided_cents_n
+        if n == buf.size:
+            buf = np.empty(max(2*n, 64), dtype=np.float32)
+            buf[:n] = self.guided_cents_buf[:n]
+            self.guided_cents_buf = buf
+        buf[n] = cents
+        self.guided_cents_n = n + 1
 
     def _guided_finish(self):
         C     = self.C
@@ -1964,10 +2598,12 @@ class VocalRiyaaz:
     def on_closing(self):
         self.running = False; self.metro_running = False
         self.drone_playing = False; self.guided_active = False
-        time.sleep(0.15)
-        if self.stream:
-            try: self.stream.stop_stream(); self.stream.close()
-            except Exception: pass
+        self._ring_evt.set()
+        self._capture_done.wait(timeout=0.2)   # woken capture exits at once
+        for st in (self.stream, self._out_stream):
+            if st:
+                try: st.stop_stream(); st.close()
+                except Exception: pass
         try: self.p.terminate()
         except Exception: pass
         self.root.destroy()